@@ -1,7 +1,12 @@
 #vacancies.csv
 import csv
 import codecs
-import re
+from cleaner import Cleaner
+from heavy_hitters import SpaceSaving, CapacityError
+from instrumentation import Instrumentation
+
+
+instrumentation = Instrumentation.from_environment()
 
 
 def validate(element, properties_count):
@@ -22,17 +27,14 @@ def make_dictionary(key, value):
     return result
 
 
-CLEANER = re.compile('<.*?>')
-SPACE_CLEANER = re.compile('(\s\s+)|(\xa0)')
-def clean_properties(merits):
+CLEANER = Cleaner()
+def clean_properties(merits, keys):
     result = []
-    for merit in merits:
+    for merit, key in zip(merits, keys):
         temp_property = merit.replace("\r\n", '\n')
         temp_property = temp_property.split('\n')
         for i in range(len(temp_property)):
-            temp_property[i] = temp_property[i].strip(' ')
-            temp_property[i] = re.sub(CLEANER, '', temp_property[i])
-            temp_property[i] = re.sub(SPACE_CLEANER, ' ', temp_property[i])
+            temp_property[i] = CLEANER.clean(temp_property[i].strip(' '), key)
         result.append(temp_property)
     return result
 
@@ -41,33 +43,72 @@ def increass_or_add(dictionary, key):
     dictionary.update({key: dictionary.get(key, 0) + 1})
 
 
-file_name = input()
-csv_reader = csv.reader(codecs.open(file_name, "r", "utf_8_sig"), delimiter=',')
-head_line = csv_reader.__next__()
-vacancies = []
-vacancies_in_cities = {}
-vacancies_count_in_cities = {}
+def count_vacancies(vacancies):
+    vacancies_in_cities = {}
+    vacancies_count_in_cities = {}
+    for dictionary in vacancies:
+        x = vacancies_in_cities.setdefault(dictionary["area_name"][0], {})
+        increass_or_add(x, dictionary['name'][0])
+
+        increass_or_add(vacancies_count_in_cities, dictionary["area_name"][0])
+    return vacancies_in_cities, vacancies_count_in_cities
+
+
+def drop_rare(vacancies_in_cities, vacancies_count_in_cities):
+    for key in vacancies_count_in_cities.keys():
+        temp = list(vacancies_in_cities[key].keys()).copy()
+        for city_vacancy in temp:
+            if vacancies_in_cities[key][city_vacancy] / vacancies_count_in_cities[key] <= 0.01:
+                vacancies_in_cities[key].pop(city_vacancy)
+    return vacancies_in_cities
 
-for vacancy in csv_reader:
-    if validate(vacancy, len(head_line)):
-        dictionary = make_dictionary(head_line, clean_properties(vacancy))
-        if dictionary["salary_currency"] == ["RUR"]:
-            vacancies.append(dictionary)
 
-            x = vacancies_in_cities.setdefault(dictionary["area_name"][0], {})
-            increass_or_add(x, dictionary['name'][0])
+def count_heavy_hitters(vacancies, capacity, share=0.01):
+    counters_in_cities = {}
+    for dictionary in vacancies:
+        counters = counters_in_cities.get(dictionary["area_name"][0])
+        if counters is None:
+            counters = SpaceSaving(capacity)
+            counters_in_cities[dictionary["area_name"][0]] = counters
+        counters.add(dictionary['name'][0])
+    return {city: counters.heavy_hitters(share) for city, counters in counters_in_cities.items()}
 
-            increass_or_add(vacancies_count_in_cities, dictionary["area_name"][0])
-        # vacancies.append(dictionary)
 
-for key in vacancies_count_in_cities.keys():
-    temp = list(vacancies_in_cities[key].keys()).copy()
-    for city_vacancy in temp:
-        if vacancies_in_cities[key][city_vacancy] / vacancies_count_in_cities[key] <= 0.01:
-            vacancies_in_cities[key].pop(city_vacancy)
+def is_rouble(dictionary):
+    return dictionary["salary_currency"] == ["RUR"]
+
+
+def read_vacancies(csv_reader, head_line):
+    validate_vacancy = instrumentation.timed("validate", validate)
+    filter_vacancy = instrumentation.timed("filter", is_rouble)
+    for vacancy in csv_reader:
+        if validate_vacancy(vacancy, len(head_line)):
+            dictionary = make_dictionary(head_line, clean_properties(vacancy, head_line))
+            if filter_vacancy(dictionary):
+                yield dictionary
+
+
+file_name = input()
+csv_reader = csv.reader(codecs.open(file_name, "r", "utf_8_sig"), delimiter=',')
+head_line = csv_reader.__next__()
+try:
+    capacity = SpaceSaving.capacity_from_environment()
+except CapacityError:
+    print("Размер счётчика задан некорректно")
+    exit()
+
+vacancies = instrumentation.wrap("clean", read_vacancies(instrumentation.wrap("read", csv_reader), head_line))
+with instrumentation.stage("aggregate"):
+    if capacity is None:
+        vacancies_in_cities, vacancies_count_in_cities = count_vacancies(vacancies)
+        drop_rare(vacancies_in_cities, vacancies_count_in_cities)
+    else:
+        vacancies_in_cities = count_heavy_hitters(vacancies, capacity)
 
 # for vacancy in vacancies:
 #     for vacancy_property in vacancy.keys():
 #         print("%s: %s" % (vacancy_property, ", ".join(vacancy[vacancy_property]).strip(' ')))
 #     print()
-print(vacancies_in_cities)
\ No newline at end of file
+with instrumentation.stage("render"):
+    print(vacancies_in_cities)
+instrumentation.emit()
\ No newline at end of file
@@ -1,14 +1,17 @@
 #vacancies_medium.csv
 import csv
 import codecs
-import re
 import enum
 from prettytable import PrettyTable
 from datetime import datetime
 from typing import Generator
+from cleaner import Cleaner
+from instrumentation import Instrumentation
 
-CLEANER = re.compile('<.*?>')
-SPACE_CLEANER = re.compile('(\s\s+)|(\xa0)')
+instrumentation = Instrumentation.from_environment()
+
+CLEANER = Cleaner()
+DISPLAY_LENGTH = 100
 TRANSLATION_EXPERIENCE = {
     "noExperience": "Нет опыта",
     "between1And3": "От 1 года до 3 лет",
@@ -66,15 +69,15 @@ def validate(element: list, properties_count: int) -> bool:
     return True
 
 
-def clean_properties(merits: list) -> list:
+def clean_properties(merits: list, keys: list) -> list:
     result = []
-    for merit in merits:
+    for merit, key in zip(merits, keys):
         temp_property = merit.replace("\r\n", '\n')
         temp_property = temp_property.split('\n')
         for i in range(len(temp_property)):
             temp_property[i] = temp_property[i].strip(' ')
-            temp_property[i] = re.sub(CLEANER, '', temp_property[i])
-            temp_property[i] = re.sub(SPACE_CLEANER, ' ', temp_property[i])
+            if key != HeadKey.description.name:
+                temp_property[i] = CLEANER.clean(temp_property[i], key)
         result.append(temp_property)
     return result
 
@@ -96,29 +99,44 @@ def get_salary(vacancy: dict) -> str:
 
 
 def csv_filer(reader: list, list_naming: list) -> Generator[dict, None, None]:
+    validate_line = instrumentation.timed("validate", validate)
     for line in reader:
-        if validate(line, len(list_naming)):
-            yield make_dictionary(list_naming, clean_properties(line))
+        if validate_line(line, len(list_naming)):
+            yield make_dictionary(list_naming, clean_properties(line, list_naming))
 
 
 def csv_reader(file_name: str) -> list:
-    reader = csv.reader(codecs.open(file_name, "r", "utf_8_sig"), delimiter=',')
-    reader.__next__()
-    return list(reader)
+    with instrumentation.stage("read"):
+        reader = csv.reader(codecs.open(file_name, "r", "utf_8_sig"), delimiter=',')
+        reader.__next__()
+        vacancies = list(reader)
+    instrumentation.count("read", rows_out=len(vacancies))
+    return vacancies
+
+
+def make_description(lines: list) -> str:
+    result = []
+    length = -2
+    for line in lines:
+        if length > DISPLAY_LENGTH:
+            break
+        result.append(CLEANER.clean_prefix(line, HeadKey.description.name, DISPLAY_LENGTH - max(length + 2, 0)))
+        length += len(result[-1]) + 2
+    return ", ".join(result)
 
 
 def make_table_row(row: dict) -> list:
     for row_value in row.values():
         row_value = row_value[0]
-        if len(row_value) > 100:
-            row_value = row_value[:100] + "..."
+        if len(row_value) > DISPLAY_LENGTH:
+            row_value = row_value[:DISPLAY_LENGTH] + "..."
         yield row_value
 
 
 def formatter(row: dict) -> list:
     datetime_obj = datetime.strptime(row[HeadKey.published_at][0], "%Y-%m-%dT%H:%M:%S%z")
 
-    row[HeadKey.description] = [", ".join(row[HeadKey.description])]
+    row[HeadKey.description] = [make_description(row[HeadKey.description])]
     row[HeadKey.key_skills] = ["\n".join(row[HeadKey.key_skills])]
     row[HeadKey.premium][0] = TRANSLATION_PREMIUM[row[HeadKey.premium][0].capitalize()]
     row[HeadKey.experience_id][0] = TRANSLATION_EXPERIENCE[row[HeadKey.experience_id][0]]
@@ -141,7 +159,8 @@ def print_vacancies(data_vacancies: Generator[dict, None, None]) -> None:
 
     for vacancy in data_vacancies:
         row_count += 1
-        my_table.add_row([row_count] + formatter(vacancy))
+        with instrumentation.stage("render"):
+            my_table.add_row([row_count] + formatter(vacancy))
 
     my_table.hrules = 1
     my_table.field_names = [
@@ -160,7 +179,9 @@ def print_vacancies(data_vacancies: Generator[dict, None, None]) -> None:
     my_table.min_width = 20
     my_table._min_width = {"№": 0}
     my_table.align = 'l'
-    print(my_table)
+    with instrumentation.stage("render"):
+        print(my_table)
+    instrumentation.count("render", rows_out=row_count)
 
 
 try:
@@ -168,6 +189,7 @@ try:
     if len(vacancies) == 0:
         print("Нет данных")
     else:
-        print_vacancies(csv_filer(vacancies, list(HeadKey.__members__)))
+        print_vacancies(instrumentation.wrap("clean", csv_filer(vacancies, list(HeadKey.__members__))))
 except StopIteration:
     print("Пустой файл")
+instrumentation.emit()
@@ -1,11 +1,18 @@
 import csv
 import codecs
-import re
 import enum
+from array import array
 from datetime import datetime
-from typing import Generator
+from typing import Generator, Iterable
+from cleaner import Cleaner
+from date_parser import DateParser
+from print_window import PrintWindow
+from filter_expression import FilterExpression
+from instrumentation import Instrumentation
+from vacancy_index import IntervalIndex, SkillIndex
 
 
+instrumentation = Instrumentation.from_environment()
 file = input("Введите название файла: ")
 
 
@@ -40,9 +47,13 @@ try:
     def vacancy_parser(func):
         from prettytable import PrettyTable
 
-        def get_filter(string: str) -> tuple or None:
+        def get_filter(string: str) -> tuple or FilterExpression or None:
             if string == '':
                 return None
+            expression = FilterExpression.parse(string, translation_filter, get_condition)
+            return expression.condition if expression.kind == FilterExpression.CONDITION else expression
+
+        def get_condition(string: str) -> tuple:
             if not string.__contains__(':'):
                 raise IOError
             filter_rules = [x.strip() for x in string.split(':')]
@@ -188,6 +199,10 @@ try:
                 to_sort[HeadKey.description][0]
         }
 
+        cleaner = Cleaner()
+        display_length = 100
+        deferred_columns = (HeadKey.description,)
+
         filter_parameter = input("Введите параметр фильтрации: ")
         sorter_parameter = input("Введите параметр сортировки: ").strip()
         is_sort_reversed = input("Обратный порядок сортировки (Да / Нет): ")
@@ -225,7 +240,27 @@ try:
             table._min_width = {"№": 0}
             table.align = 'l'
 
+        def get_expression() -> FilterExpression:
+            if isinstance(filter_parameter, FilterExpression):
+                return filter_parameter
+            return FilterExpression.from_condition(filter_parameter)
+
+        def get_columns() -> list:
+            needed = [condition[0] for condition in get_expression().conditions()] if filter_parameter else []
+            if sorter_parameter != "":
+                needed.append(translation_filter[sorter_parameter])
+            return [key.name for key in HeadKey if key not in deferred_columns or key in needed]
+
+        columns = get_columns()
+
+        def clean_deferred(row: dict, columns: list) -> dict:
+            for key in deferred_columns:
+                if key.name not in columns:
+                    row[key] = [cleaner.clean_prefix(row[key][0], key.name, display_length)] + row[key][1:]
+            return row
+
         def formatter(row: dict) -> list:
+            row = clean_deferred(dict(row), columns)
             for function in formatter_row:
                 function(row)
 
@@ -234,8 +269,8 @@ try:
         def make_table_row(row: dict) -> list:
             for row_value in row.values():
                 row_value = row_value[0]
-                if len(row_value) > 100:
-                    row_value = row_value[:100] + "..."
+                if len(row_value) > display_length:
+                    row_value = row_value[:display_length] + "..."
                 yield row_value
 
         def are_equal(first: datetime, second: datetime) -> bool:
@@ -268,16 +303,17 @@ try:
 
             return dictionary
 
-        def print_vacancies(data_vacancies: list) -> None:
+        def print_vacancies(data_vacancies: list, window: PrintWindow = None, row_count: int = None) -> None:
             my_table = PrettyTable()
-            row_count = 0
+            first_number = window.start if window else 1
             nonlocal print_columns
             nonlocal print_range
 
-            for row in data_vacancies:
-                row_count += 1
-                my_table.add_row([row_count] + formatter(row))
+            for number, row in enumerate(data_vacancies, first_number):
+                my_table.add_row([number] + formatter(row))
 
+            if row_count is None:
+                row_count = len(data_vacancies)
             if row_count == 0:
                 raise AssertionError
 
@@ -287,6 +323,10 @@ try:
             else:
                 print_columns.insert(0, "№")
 
+            if window:
+                print(my_table.get_string(fields=print_columns))
+                return
+
             if print_range[0] == '':
                 print_range = [1, row_count + 1]
             elif len(print_range) < 2:
@@ -299,24 +339,64 @@ try:
                 end=print_range[1] - 1
             ))
 
+        def get_salary_index(vacancies: list) -> IntervalIndex:
+            return IntervalIndex(
+                array('q', [int(vacancy[HeadKey.salary_from][0]) for vacancy in vacancies]),
+                array('q', [int(vacancy[HeadKey.salary_to][0]) for vacancy in vacancies])
+            )
+
+        indexed_filter = {
+            HeadKey.salary: lambda vacancies, filter_key: get_salary_index(vacancies).stab(filter_key),
+            HeadKey.key_skills: lambda vacancies, filter_key:
+                SkillIndex(vacancy[HeadKey.key_skills] for vacancy in vacancies).lookup_all(filter_key)
+        }
+
+        def select(vacancies: Iterable[dict]) -> Iterable[dict]:
+            if not filter_parameter:
+                return vacancies
+            expression = get_expression()
+            if all(condition[0] not in indexed_filter for condition in expression.conditions()):
+                return filter(instrumentation.timed("filter", expression.compile(filter_checker)), vacancies)
+
+            vacancies = list(vacancies)
+            with instrumentation.stage("index"):
+                row_ids, residual = expression.plan(
+                    lambda condition:
+                        indexed_filter[condition[0]](vacancies, condition[1])
+                        if condition[0] in indexed_filter else None,
+                    len(vacancies)
+                )
+            if row_ids is not None:
+                instrumentation.count("index", rows_in=len(vacancies), rows_out=len(row_ids))
+                vacancies = [vacancies[row_id] for row_id in row_ids]
+            if residual is not None:
+                vacancies = filter(instrumentation.timed("filter", residual.compile(filter_checker)), vacancies)
+            return vacancies
+
         def wrapper(*args):
-            vacancies = []
-            for vacancy in func(*args):
-                if (not filter_parameter) or \
-                        (not filter_checker.__contains__(filter_parameter[0]) and
-                         vacancy[filter_parameter[0]][0] == filter_parameter[1]) or \
-                        (filter_checker[filter_parameter[0]](vacancy, filter_parameter[1])):
-                    vacancies.append(vacancy)
-
-            print_vacancies(vacancy_sort(vacancies, sorter_parameter, is_sort_reversed))
+            vacancies = select(func(*args, columns))
+
+            window = PrintWindow(print_range)
+            if window.is_valid:
+                sort_key = sorter[translation_filter[sorter_parameter]] if sorter_parameter != "" else None
+                with instrumentation.stage("sort"):
+                    vacancies, row_count = window.select(vacancies, sort_key, is_sort_reversed)
+                with instrumentation.stage("render"):
+                    print_vacancies(vacancies, window, row_count)
+            else:
+                with instrumentation.stage("sort"):
+                    vacancies = vacancy_sort(list(vacancies), sorter_parameter, is_sort_reversed)
+                with instrumentation.stage("render"):
+                    print_vacancies(vacancies)
+            instrumentation.count("render", rows_out=len(vacancies))
             return vacancies
 
         return wrapper
 
 
     class CsvParser:
-        __CLEANER = re.compile('<.*?>')
-        __SPACE_CLEANER = re.compile('(\s\s+)|(\xa0)')
+        __CLEANER = Cleaner()
+        __DATE_PARSER = DateParser()
 
         @staticmethod
         def parse_to_bool(string: str):
@@ -324,19 +404,21 @@ try:
 
         @staticmethod
         def __reader(file_name: str) -> list:
-            reader = csv.reader(codecs.open(file_name, "r", "utf_8_sig"), delimiter=',')
-            reader.__next__()
-            return list(reader)
+            with instrumentation.stage("read"):
+                reader = csv.reader(codecs.open(file_name, "r", "utf_8_sig"), delimiter=',')
+                reader.__next__()
+                vacancies = list(reader)
+            instrumentation.count("read", rows_out=len(vacancies))
+            return vacancies
 
         @staticmethod
         def __make_dictionary(keys: list, values: list) -> dict:
             keys = list(map(lambda x: HeadKey.__getitem__(x), keys))
             result = dict(zip(keys, values))
-            result[HeadKey.published_at] = [datetime.strptime(
-                result[HeadKey.published_at][0],
-                "%Y-%m-%dT%H:%M:%S%z"
-            )]
+            result[HeadKey.published_at] = [CsvParser.__DATE_PARSER.parse(result[HeadKey.published_at][0])]
             result[HeadKey.published_at][0] = result[HeadKey.published_at][0].replace(tzinfo=None)
+            result[HeadKey.salary_from] = [float(result[HeadKey.salary_from][0])]
+            result[HeadKey.salary_to] = [float(result[HeadKey.salary_to][0])]
             return result
 
         @staticmethod
@@ -348,28 +430,34 @@ try:
                     return False
             return True
 
-        def __clean_properties(self, merits: list) -> list:
+        def __clean_properties(self, merits: list, keys: list, columns: list) -> list:
             result = []
-            for merit in merits:
+            for merit, key in zip(merits, keys):
                 temp_property = merit.replace("\r\n", '\n')
                 temp_property = temp_property.split('\n')
+                if key not in columns:
+                    result.append(temp_property)
+                    continue
                 for i in range(len(temp_property)):
-                    temp_property[i] = re.sub(self.__CLEANER, '', temp_property[i])
-                    temp_property[i] = re.sub(self.__SPACE_CLEANER, ' ', temp_property[i])
+                    temp_property[i] = self.__CLEANER.clean(temp_property[i], key)
                 result.append(temp_property)
             return result
 
-        def __csv_filer(self, reader: list, list_naming: list) -> Generator[dict, None, None]:
+        def __csv_filer(self, reader: list, list_naming: list, columns: list) -> Generator[dict, None, None]:
+            validate = instrumentation.timed("validate", self.__validate)
             for line in reader:
-                if self.__validate(line, len(list_naming)):
-                    yield self.__make_dictionary(list_naming, self.__clean_properties(line))
+                if validate(line, len(list_naming)):
+                    yield self.__make_dictionary(list_naming, self.__clean_properties(line, list_naming, columns))
 
         @vacancy_parser
-        def csv_parse(self, file_name):
+        def csv_parse(self, file_name, columns: list = None):
             data = self.__reader(file_name)
             if len(data) == 0:
                 raise OutOfDataError
-            return self.__csv_filer(data, list(HeadKey.__members__))
+            list_naming = list(HeadKey.__members__)
+            if columns is None:
+                columns = list_naming
+            return instrumentation.wrap("clean", self.__csv_filer(data, list_naming, columns))
 
 
     csv_parser = CsvParser()
@@ -389,3 +477,5 @@ except SortWayError:
     print("Порядок сортировки задан некорректно")
 except OutOfDataError:
     print("Нет данных")
+
+instrumentation.emit()
@@ -0,0 +1,185 @@
+import json
+import math
+from typing import Dict, List, Iterable, Tuple
+from quantile_sketch import QuantileSketch, KllSketch, ExactQuantiles
+
+
+class Accumulator:
+    def __init__(self, quantiles: KllSketch or ExactQuantiles = None):
+        self.quantiles = quantiles
+        self.count = 0
+        self.partials = []
+        self.min = None
+        self.max = None
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.__add_partial(value)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.quantiles is not None:
+            self.quantiles.add(value)
+
+    def merge(self, other: "Accumulator") -> "Accumulator":
+        if other.count == 0:
+            return self
+        if other.quantiles is not None:
+            if self.quantiles is None:
+                self.quantiles = other.quantiles.copy()
+            else:
+                self.quantiles.merge(other.quantiles)
+        if self.count == 0:
+            self.count, self.partials, self.min, self.max, self.mean, self.m2 = \
+                other.count, list(other.partials), other.min, other.max, other.mean, other.m2
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        for partial in other.partials:
+            self.__add_partial(partial)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def sum(self) -> float:
+        return math.fsum(self.partials)
+
+    def __add_partial(self, value: float) -> None:
+        partials = self.partials
+        index = 0
+        for partial in partials:
+            if abs(value) < abs(partial):
+                value, partial = partial, value
+            high = value + partial
+            low = partial - (high - value)
+            if low:
+                partials[index] = low
+                index += 1
+            value = high
+        partials[index:] = [value]
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def sample_variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def quantile(self, share: float) -> float or None:
+        if self.quantiles is None:
+            return None
+        return self.quantiles.quantile(share)
+
+    def to_dict(self) -> Dict[str, float]:
+        state = {
+            "count": self.count,
+            "sum": self.sum,
+            "partials": list(self.partials),
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "m2": self.m2
+        }
+        if self.quantiles is not None:
+            state["quantiles"] = self.quantiles.to_dict()
+        return state
+
+    @staticmethod
+    def from_dict(state: Dict[str, float]) -> "Accumulator":
+        accumulator = Accumulator()
+        accumulator.count = state["count"]
+        accumulator.partials = list(state.get("partials", [state["sum"]]))
+        accumulator.min = state["min"]
+        accumulator.max = state["max"]
+        accumulator.mean = state["mean"]
+        accumulator.m2 = state["m2"]
+        if "quantiles" in state:
+            accumulator.quantiles = QuantileSketch.from_dict(state["quantiles"])
+        return accumulator
+
+
+class KeyedAccumulator:
+    def __init__(self, quantiles: str = None):
+        self.quantiles = quantiles
+        self.groups = {}
+        self.positions = {}
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def __contains__(self, key: any) -> bool:
+        return key in self.groups
+
+    def __getitem__(self, key: any) -> Accumulator:
+        return self.groups[key]
+
+    def keys(self) -> Iterable[any]:
+        return self.groups.keys()
+
+    def add(self, key: any, value: float, position: int = None) -> None:
+        accumulator = self.groups.get(key)
+        if accumulator is None:
+            accumulator = Accumulator(QuantileSketch.make(self.quantiles) if self.quantiles else None)
+            self.groups[key] = accumulator
+            if position is not None:
+                self.positions[key] = position
+        accumulator.add(value)
+
+    def merge(self, other: "KeyedAccumulator") -> "KeyedAccumulator":
+        for key, accumulator in other.groups.items():
+            if key in self.groups:
+                self.groups[key].merge(accumulator)
+            else:
+                self.groups[key] = Accumulator().merge(accumulator)
+        for key, position in other.positions.items():
+            if key not in self.positions or position < self.positions[key]:
+                self.positions[key] = position
+        return self
+
+    def sort_by_position(self) -> "KeyedAccumulator":
+        last = len(self.groups)
+        self.groups = dict(sorted(
+            self.groups.items(),
+            key=lambda item: self.positions.get(item[0], last)
+        ))
+        return self
+
+    def counts(self) -> Dict[any, int]:
+        return {key: accumulator.count for key, accumulator in self.groups.items()}
+
+    def truncated_means(self) -> Dict[any, int]:
+        return {key: int(accumulator.sum / accumulator.count) for key, accumulator in self.groups.items()}
+
+    def truncated_quantiles(self, shares: Tuple[float, ...] = QuantileSketch.SHARES) -> Dict[any, Tuple[int, ...]]:
+        return {
+            key: tuple(int(accumulator.quantile(share)) for share in shares)
+            for key, accumulator in self.groups.items() if accumulator.quantiles is not None
+        }
+
+    def to_list(self) -> List[list]:
+        return [[key, accumulator.to_dict()] for key, accumulator in self.groups.items()]
+
+    @staticmethod
+    def from_list(state: List[list]) -> "KeyedAccumulator":
+        keyed = KeyedAccumulator()
+        for key, accumulator in state:
+            keyed.groups[key] = Accumulator.from_dict(accumulator)
+        return keyed
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_list(), ensure_ascii=False)
+
+    @staticmethod
+    def from_json(text: str) -> "KeyedAccumulator":
+        return KeyedAccumulator.from_list(json.loads(text))
@@ -0,0 +1,155 @@
+import codecs
+import contextlib
+import csv
+import gc
+import io
+import json
+import os
+import time
+from typing import Dict, List
+from vacancy_generator import VacancyGenerator
+from instrumentation import Instrumentation
+from benchmark_tools import load_script
+
+
+class BenchmarkRunner:
+    STAGES = (
+        "read", "validate", "clean", "dedup", "vacancy", "store", "cache", "index", "filter",
+        "statistics", "aggregate", "summary", "sort", "clean_deferred", "render"
+    )
+    FILTER = "Идентификатор валюты оклада: Рубли"
+    SORT = "Оклад"
+    PRINT_RANGE = "1 101"
+    PROFESSION = "Программист"
+
+    def __init__(self):
+        self.__scripts = {
+            "Pram.py": (self.__run_pram, False),
+            "Refactor.py": (self.__run_refactor, True),
+            "Table.py": (self.__run_table, True),
+            "task5.py": (self.__run_task5, True),
+            "task5.3.py": (self.__run_statistics, False)
+        }
+
+    def run(self, file_name: str) -> List[dict]:
+        reader = csv.reader(codecs.open(file_name, "r", "utf_8_sig"), delimiter=',')
+        headline = reader.__next__()
+        rows = sum(1 for _ in reader)
+        results = []
+        for script, (run, is_full) in self.__scripts.items():
+            result = {"script": script, "file": file_name, "columns": len(headline), "rows": rows}
+            if is_full and headline != VacancyGenerator.FULL_HEADLINE:
+                result["skipped"] = "требуется полный формат"
+                results.append(result)
+                continue
+            gc.collect()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                instrumentation = run(file_name)
+            result["total"] = time.perf_counter() - start
+            result["stages"] = {} if instrumentation is None else {
+                stage: metrics.time for stage, metrics in instrumentation.stages.items()
+            }
+            results.append(result)
+        return results
+
+    @staticmethod
+    @contextlib.contextmanager
+    def __profiling():
+        original = os.environ.get(Instrumentation.OUTPUT_VARIABLE)
+        os.environ[Instrumentation.OUTPUT_VARIABLE] = os.devnull
+        try:
+            yield
+        finally:
+            if original is None:
+                del os.environ[Instrumentation.OUTPUT_VARIABLE]
+            else:
+                os.environ[Instrumentation.OUTPUT_VARIABLE] = original
+
+    def __run_pram(self, file_name: str) -> Instrumentation:
+        with self.__profiling():
+            module = load_script("pram", "Pram.py", [file_name])
+        return module.instrumentation
+
+    def __run_refactor(self, file_name: str) -> Instrumentation:
+        with self.__profiling():
+            module = load_script("refactor", "Refactor.py", [file_name])
+        return module.instrumentation
+
+    def __run_table(self, file_name: str) -> Instrumentation:
+        with self.__profiling():
+            module = load_script(
+                "table",
+                "Table.py",
+                [file_name, self.FILTER, self.SORT, "Нет", self.PRINT_RANGE, ""]
+            )
+        return module.instrumentation
+
+    def __run_task5(self, file_name: str) -> Instrumentation:
+        module = load_script("task5", "task5.py")
+        instrumentation = Instrumentation(True)
+        print(module.InputConnect(
+            file_name,
+            self.FILTER,
+            self.SORT,
+            "Нет",
+            self.PRINT_RANGE,
+            "",
+            columnar=True,
+            instrumentation=instrumentation
+        ))
+        return instrumentation
+
+    def __run_statistics(self, file_name: str) -> Instrumentation:
+        module = load_script("task5_3", "task5.3.py")
+        instrumentation = Instrumentation(True)
+        module.InputConnect(
+            file_name,
+            self.PROFESSION,
+            columnar=True,
+            instrumentation=instrumentation
+        ).print_self()
+        return instrumentation
+
+
+def print_results(results: List[dict]) -> None:
+    stages = [
+        stage for stage in BenchmarkRunner.STAGES
+        if any(stage in result.get("stages", {}) for result in results)
+    ]
+    print("{:<14}{:<36}{:>10}".format("Скрипт", "Файл", "Строк") + "".join(
+        "{:>15}".format(stage) for stage in stages
+    ) + "{:>11}".format("total"))
+    for result in results:
+        if "skipped" in result:
+            continue
+        print("{:<14}{:<36}{:>10}".format(result["script"], os.path.basename(result["file"]), result["rows"]) + "".join(
+            "{:>15.3f}".format(result["stages"][stage]) if stage in result["stages"] else "{:>15}".format("-")
+            for stage in stages
+        ) + "{:>11.3f}".format(result["total"]))
+
+
+def generate_files(directory: str, sizes: List[int], seed: int = 0) -> Dict[str, str]:
+    files = {}
+    for size in sizes:
+        for is_short in (False, True):
+            file_name = os.path.join(directory, "vacancies_{0}{1}.csv".format(size, "_short" if is_short else ""))
+            if not os.path.exists(file_name):
+                VacancyGenerator(seed).write(file_name, size, is_short)
+            files[file_name] = "short" if is_short else "full"
+    return files
+
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in (input("Введите количество строк через пробел: ").strip() or "10000").split()]
+    directory = input("Введите папку для данных: ").strip() or "benchmark_data"
+    output = input("Введите название файла результатов: ").strip() or "benchmark.json"
+    runner = BenchmarkRunner()
+    results = []
+    for file_name, form in generate_files(directory, sizes).items():
+        for result in runner.run(file_name):
+            result["form"] = form
+            results.append(result)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(results, file, ensure_ascii=False, indent=2)
+    print_results(results)
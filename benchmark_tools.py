@@ -0,0 +1,66 @@
+import builtins
+import contextlib
+import importlib.util
+import os
+import time
+import tracemalloc
+from typing import Callable, List
+
+
+class ScriptStopped(BaseException):
+    pass
+
+
+def load_script(name: str, path: str, answers: List[str] = None):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(os.path.dirname(os.path.abspath(__file__)), path))
+    module = importlib.util.module_from_spec(spec)
+    if answers is None:
+        spec.loader.exec_module(module)
+        return module
+    with answering(answers):
+        try:
+            spec.loader.exec_module(module)
+        except ScriptStopped:
+            pass
+    return module
+
+
+def without_slots(module, *names: str):
+    for name in names:
+        slotted = getattr(module, name)
+        namespace = {
+            key: value for key, value in slotted.__dict__.items()
+            if key not in slotted.__slots__ and key not in ("__slots__", "__dict__", "__weakref__")
+        }
+        plain = type(slotted.__name__, slotted.__bases__, namespace)
+        plain.__slots__ = slotted.__slots__
+        setattr(module, name, plain)
+    return module
+
+
+@contextlib.contextmanager
+def answering(answers: List[str]):
+    answers = iter(answers)
+
+    def answer(prompt: str = "") -> str:
+        value = next(answers, None)
+        if value is None:
+            raise ScriptStopped
+        return value
+
+    original = builtins.input
+    builtins.input = answer
+    try:
+        yield
+    finally:
+        builtins.input = original
+
+
+def measure(load: Callable) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current, peak
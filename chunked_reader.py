@@ -0,0 +1,54 @@
+import os
+from typing import List, Tuple, Generator, BinaryIO
+
+
+class ChunkedReader:
+    __BLOCK_SIZE = 8 * 2 ** 20
+
+    @staticmethod
+    def split(file_name: str, chunks: int) -> List[Tuple[int, int]]:
+        size = os.path.getsize(file_name)
+        with open(file_name, "rb") as file:
+            quoted = False
+            position, quoted = ChunkedReader.__record_end(file, quoted, size)
+            boundaries = [position]
+            data_start = position
+            for chunk in range(1, chunks):
+                target = data_start + (size - data_start) * chunk // chunks
+                if target <= position:
+                    continue
+                file.seek(position)
+                remaining = target - position
+                while remaining > 0:
+                    block = file.read(min(ChunkedReader.__BLOCK_SIZE, remaining))
+                    if not block:
+                        break
+                    quoted ^= block.count(b'"') % 2 == 1
+                    remaining -= len(block)
+                position, quoted = ChunkedReader.__record_end(file, quoted, size)
+                if position < size:
+                    boundaries.append(position)
+        boundaries.append(size)
+        return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+    @staticmethod
+    def read_lines(file_name: str, start: int, end: int, encoding: str = "utf-8") -> Generator[str, None, None]:
+        with open(file_name, "rb") as file:
+            file.seek(start)
+            position = start
+            while position < end:
+                line = file.readline()
+                if not line:
+                    break
+                position += len(line)
+                yield line.decode(encoding)
+
+    @staticmethod
+    def __record_end(file: BinaryIO, quoted: bool, size: int) -> Tuple[int, bool]:
+        while True:
+            line = file.readline()
+            if not line:
+                return size, False
+            quoted ^= line.count(b'"') % 2 == 1
+            if not quoted:
+                return file.tell(), quoted
@@ -0,0 +1,69 @@
+import re
+from typing import Dict
+
+
+class Cleaner:
+    HTML = "html"
+    TEXT = "text"
+    RAW = "raw"
+    DEFAULT_POLICIES = {
+        "salary_from": TEXT,
+        "salary_to": TEXT,
+        "salary_gross": TEXT,
+        "salary_currency": TEXT,
+        "published_at": TEXT,
+        "premium": TEXT,
+        "experience_id": TEXT
+    }
+    TAGS = re.compile('<[^>\n]*>')
+    SPACES = re.compile('(\\s\\s+)|(\xa0)')
+
+    def __init__(self, policies: Dict[str, str] = None):
+        self.policies = dict(self.DEFAULT_POLICIES)
+        if policies:
+            self.policies.update(policies)
+
+    def clean(self, value: str, column: str = None) -> str:
+        policy = self.policies.get(column, self.HTML)
+        if policy == self.HTML:
+            return self.clean_html(value)
+        if policy == self.TEXT:
+            return self.collapse_spaces(value)
+        return value
+
+    def clean_prefix(self, value: str, column: str = None, length: int = 100) -> str:
+        policy = self.policies.get(column, self.HTML)
+        end = 2 * length + 2
+        while end < len(value):
+            prefix = self.__clean_until(value, end, policy)
+            if len(prefix.lstrip()) > length:
+                return prefix
+            end *= 2
+        return self.clean(value, column)
+
+    @staticmethod
+    def clean_html(value: str) -> str:
+        if '<' in value:
+            value = Cleaner.TAGS.sub('', value)
+        return Cleaner.collapse_spaces(value)
+
+    @staticmethod
+    def collapse_spaces(value: str) -> str:
+        if value.isprintable() and '  ' not in value:
+            return value
+        return Cleaner.SPACES.sub(' ', value)
+
+    @staticmethod
+    def __clean_until(value: str, end: int, policy: str) -> str:
+        if policy == Cleaner.HTML:
+            separator = max(value.rfind('>', 0, end), value.rfind('\n', 0, end))
+            tag_start = value.find('<', separator + 1, end)
+            if tag_start != -1:
+                end = tag_start
+        prefix = value[:end]
+        if policy == Cleaner.HTML and '<' in prefix:
+            prefix = Cleaner.TAGS.sub('', prefix)
+        prefix = prefix.rstrip()
+        if policy == Cleaner.RAW:
+            return prefix
+        return Cleaner.collapse_spaces(prefix)
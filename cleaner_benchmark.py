@@ -0,0 +1,44 @@
+import csv
+import codecs
+import re
+import time
+from cleaner import Cleaner
+
+CLEANER = re.compile('<.*?>')
+SPACE_CLEANER = re.compile('(\s\s+)|(\xa0)')
+
+
+def regex_pair(value: str, column: str) -> str:
+    return re.sub(SPACE_CLEANER, ' ', re.sub(CLEANER, '', value))
+
+
+def measure(function, rows: list, headline: list, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            for value, column in zip(row, headline):
+                function(value, column)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+file_name = input("Введите название файла: ").strip()
+reader = csv.reader(codecs.open(file_name, "r", "utf_8_sig"), delimiter=',')
+headline = reader.__next__()
+rows = [row for row in reader if len(row) == len(headline)]
+cleaner = Cleaner()
+
+mismatches = sum(
+    regex_pair(value, column) != cleaner.clean(value, column)
+    for row in rows
+    for value, column in zip(row, headline)
+    if cleaner.policies.get(column, Cleaner.HTML) == Cleaner.HTML
+)
+fields = len(rows) * len(headline)
+print(f"Полей: {fields}, расхождений: {mismatches}")
+print("{:<16}{:>12}{:>16}".format("Режим", "Время, с", "Полей/с"))
+for mode, function in (("re.sub x2", regex_pair), ("Cleaner", cleaner.clean)):
+    elapsed = measure(function, rows, headline, 3)
+    print("{:<16}{:>12.3f}{:>16.0f}".format(mode, elapsed, fields / elapsed if elapsed else 0))
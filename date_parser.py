@@ -0,0 +1,89 @@
+from datetime import datetime, date, timedelta, timezone
+from typing import Tuple
+
+
+class DateParser:
+    DATETIME = "datetime"
+    EPOCH = "epoch"
+    YEAR = "year"
+    FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+    __EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+    __timezones = {}
+
+    def __init__(self, mode: str = DATETIME, cache_size: int = 65536):
+        self.mode = mode
+        self.cache_size = cache_size
+        self.__cache = {}
+        self.__offset_cache = {}
+        self.__convert = {
+            self.DATETIME: self.to_datetime,
+            self.EPOCH: lambda value: self.to_epoch_offset(value)[0],
+            self.YEAR: self.to_year
+        }[mode]
+
+    def parse(self, value: str) -> datetime or int:
+        result = self.__cache.get(value)
+        if result is None:
+            if len(self.__cache) >= self.cache_size:
+                self.__cache.clear()
+            result = self.__convert(value)
+            self.__cache[value] = result
+        return result
+
+    def parse_with_offset(self, value: str) -> Tuple[int, int]:
+        result = self.__offset_cache.get(value)
+        if result is None:
+            if len(self.__offset_cache) >= self.cache_size:
+                self.__offset_cache.clear()
+            result = self.to_epoch_offset(value)
+            self.__offset_cache[value] = result
+        return result
+
+    @staticmethod
+    def is_fixed_format(value: str) -> bool:
+        return len(value) == 24 \
+            and value[4] == '-' and value[7] == '-' and value[10] == 'T' \
+            and value[13] == ':' and value[16] == ':' and value[19] in "+-"
+
+    @staticmethod
+    def to_datetime(value: str) -> datetime:
+        if not DateParser.is_fixed_format(value):
+            return datetime.strptime(value, DateParser.FORMAT)
+        return datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            tzinfo=DateParser.get_timezone(DateParser.__offset(value))
+        )
+
+    @staticmethod
+    def to_epoch_offset(value: str) -> Tuple[int, int]:
+        if not DateParser.is_fixed_format(value):
+            published_at = datetime.strptime(value, DateParser.FORMAT)
+            return int(published_at.timestamp()), int(published_at.utcoffset().total_seconds()) // 60
+        offset = DateParser.__offset(value)
+        days = date(int(value[0:4]), int(value[5:7]), int(value[8:10])).toordinal() - DateParser.__EPOCH_ORDINAL
+        seconds = int(value[11:13]) * 3600 + int(value[14:16]) * 60 + int(value[17:19])
+        return days * 86400 + seconds - offset * 60, offset
+
+    @staticmethod
+    def to_year(value: str) -> int:
+        if not DateParser.is_fixed_format(value):
+            return datetime.strptime(value, DateParser.FORMAT).year
+        return int(value[0:4])
+
+    @staticmethod
+    def get_timezone(offset: int) -> timezone:
+        tz = DateParser.__timezones.get(offset)
+        if tz is None:
+            tz = timezone(timedelta(minutes=offset))
+            DateParser.__timezones[offset] = tz
+        return tz
+
+    @staticmethod
+    def __offset(value: str) -> int:
+        offset = int(value[20:22]) * 60 + int(value[22:24])
+        return -offset if value[19] == '-' else offset
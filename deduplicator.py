@@ -0,0 +1,198 @@
+import hashlib
+import math
+import mmap
+import os
+import shutil
+import tempfile
+from bisect import bisect_left
+from typing import List, Generator, Iterable, Sequence
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(64, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self.__bits = bytearray((self.size + 7) // 8)
+
+    def __contains__(self, digest: bytes) -> bool:
+        bits = self.__bits
+        size = self.size
+        position = int.from_bytes(digest[:8], "little") % size
+        step = (int.from_bytes(digest[8:16], "little") | 1) % size
+        for _ in range(self.hashes):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position = (position + step) % size
+        return True
+
+    def add(self, digest: bytes) -> bool:
+        bits = self.__bits
+        size = self.size
+        position = int.from_bytes(digest[:8], "little") % size
+        step = (int.from_bytes(digest[8:16], "little") | 1) % size
+        is_present = True
+        for _ in range(self.hashes):
+            byte = position >> 3
+            mask = 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                is_present = False
+            position = (position + step) % size
+        if not is_present:
+            self.count += 1
+        return is_present
+
+
+class SortedRun:
+    def __init__(self, path: str, record_size: int):
+        self.path = path
+        self.record_size = record_size
+        with open(path, "rb") as file:
+            self.__buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return len(self.__buffer) // self.record_size
+
+    def __getitem__(self, index: int) -> bytes:
+        start = index * self.record_size
+        return self.__buffer[start:start + self.record_size]
+
+    def __contains__(self, digest: bytes) -> bool:
+        index = bisect_left(self, digest)
+        return index < len(self) and self[index] == digest
+
+    def close(self) -> None:
+        self.__buffer.close()
+
+
+class SpillingSet:
+    def __init__(self, max_size: int = 1_000_000, capacity: int = 10_000_000, directory: str = None):
+        self.max_size = max(1, max_size)
+        self.capacity = capacity
+        self.directory = directory
+        self.count = 0
+        self.__memory = set()
+        self.__runs = []
+        self.__spilled = None
+        self.__temp_directory = None
+
+    def __contains__(self, digest: bytes) -> bool:
+        if digest in self.__memory:
+            return True
+        if self.__spilled is None or digest not in self.__spilled:
+            return False
+        return any(digest in run for run in self.__runs)
+
+    def add(self, digest: bytes) -> bool:
+        if digest in self:
+            return True
+        self.__memory.add(digest)
+        self.count += 1
+        if len(self.__memory) >= self.max_size:
+            self.__spill()
+        return False
+
+    def close(self) -> None:
+        for run in self.__runs:
+            run.close()
+        self.__runs = []
+        self.__memory = set()
+        self.__spilled = None
+        if self.__temp_directory is not None:
+            shutil.rmtree(self.__temp_directory, ignore_errors=True)
+            self.__temp_directory = None
+
+    def __spill(self) -> None:
+        if self.__temp_directory is None:
+            self.__temp_directory = tempfile.mkdtemp(prefix="vacancy_dedup_", dir=self.directory)
+            self.__spilled = BloomFilter(self.capacity, 0.01)
+        digests = sorted(self.__memory)
+        path = os.path.join(self.__temp_directory, "{0}.run".format(len(self.__runs)))
+        with open(path, "wb") as file:
+            file.write(b"".join(digests))
+        for digest in digests:
+            self.__spilled.add(digest)
+        self.__runs.append(SortedRun(path, Deduplicator.DIGEST_SIZE))
+        self.__memory = set()
+
+
+class Deduplicator:
+    EXACT = "exact"
+    BLOOM = "bloom"
+    VARIABLE = "VACANCY_DEDUP"
+    KEY = ("name", "employer_name", "area_name", "salary_from", "salary_to", "salary_currency")
+    NUMERIC = ("salary_from", "salary_to")
+    DIGEST_SIZE = 16
+    __SEPARATOR = "\x1f"
+
+    def __init__(
+            self,
+            mode: str = EXACT,
+            key: Sequence[str] = KEY,
+            capacity: int = 10_000_000,
+            error_rate: float = 0.001,
+            max_memory_keys: int = 1_000_000,
+            directory: str = None
+    ):
+        if mode not in (self.EXACT, self.BLOOM):
+            raise KeyError
+        self.mode = mode
+        self.key = tuple(key)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_memory_keys = max_memory_keys
+        self.directory = directory
+        self.duplicates = 0
+        self.__seen = None
+
+    @staticmethod
+    def from_environment() -> "Deduplicator" or None:
+        mode = os.environ.get(Deduplicator.VARIABLE, "").strip()
+        if mode == "":
+            return None
+        return Deduplicator(mode)
+
+    def get_namespace(self) -> str:
+        if self.mode == self.EXACT:
+            return "dedup:{0}:{1}".format(self.mode, ",".join(self.key))
+        return "dedup:{0}:{1}:{2}:{3}".format(self.mode, ",".join(self.key), self.capacity, self.error_rate)
+
+    def filter(self, rows: Iterable[List[any]], headline: List[str]) -> Generator[List[any], None, None]:
+        columns = [(headline.index(column), column in self.NUMERIC) for column in self.key if column in headline]
+        seen = self.__get_seen()
+        separator = self.__SEPARATOR
+        for row in rows:
+            digest = hashlib.blake2b(
+                separator.join(self.__to_string(row[index], is_numeric) for index, is_numeric in columns).encode("utf-8"),
+                digest_size=self.DIGEST_SIZE
+            ).digest()
+            if seen.add(digest):
+                self.duplicates += 1
+                continue
+            yield row
+
+    def close(self) -> None:
+        if isinstance(self.__seen, SpillingSet):
+            self.__seen.close()
+        self.__seen = None
+
+    def __get_seen(self) -> BloomFilter or SpillingSet:
+        if self.__seen is None:
+            if self.mode == self.BLOOM:
+                self.__seen = BloomFilter(self.capacity, self.error_rate)
+            else:
+                self.__seen = SpillingSet(self.max_memory_keys, self.capacity, self.directory)
+        return self.__seen
+
+    @staticmethod
+    def __to_string(value: any, is_numeric: bool) -> str:
+        if is_numeric:
+            return repr(float(value))
+        if isinstance(value, str):
+            return value
+        if isinstance(value, list):
+            return "\n".join(value)
+        return str(value)
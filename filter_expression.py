@@ -0,0 +1,124 @@
+import re
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+class FilterExpression:
+    CONDITION = "condition"
+    AND = "and"
+    OR = "or"
+    NOT = "not"
+    __SEPARATOR = re.compile("(\\s[&|]\\s)")
+
+    def __init__(self, kind: str, operands: List["FilterExpression"] = None, condition: tuple = None):
+        self.kind = kind
+        self.operands = operands or []
+        self.condition = condition
+
+    @staticmethod
+    def parse(string: str, fields: Iterable[str], parse_condition: Callable[[str], tuple]) -> "FilterExpression":
+        field_start = re.compile("^!?\\s*({0})\\s*:".format("|".join(map(re.escape, fields))))
+        parts = FilterExpression.__SEPARATOR.split(string)
+        terms = [[parts[0]]]
+        for separator, part in zip(parts[1::2], parts[2::2]):
+            if not field_start.match(part.strip()):
+                terms[-1][-1] += separator + part
+            elif separator.strip() == '|':
+                terms.append([part])
+            else:
+                terms[-1].append(part)
+
+        operands = []
+        for term in terms:
+            factors = [FilterExpression.__parse_factor(factor, parse_condition) for factor in term]
+            operands.append(factors[0] if len(factors) == 1 else FilterExpression(FilterExpression.AND, factors))
+        return operands[0] if len(operands) == 1 else FilterExpression(FilterExpression.OR, operands)
+
+    @staticmethod
+    def from_condition(condition: tuple) -> "FilterExpression":
+        return FilterExpression(FilterExpression.CONDITION, condition=condition)
+
+    def conditions(self) -> List[tuple]:
+        if self.kind == self.CONDITION:
+            return [self.condition]
+        return [condition for operand in self.operands for condition in operand.conditions()]
+
+    def compile(self, checkers: Dict[any, Callable[[any, any], bool]]) -> Callable[[any], bool]:
+        if self.kind == self.CONDITION:
+            checker, value = checkers[self.condition[0]], self.condition[1]
+            return lambda vacancy: checker(vacancy, value)
+        operands = [operand.compile(checkers) for operand in self.operands]
+        if self.kind == self.NOT:
+            return self.__negate(operands[0])
+        result = operands[0]
+        for operand in operands[1:]:
+            result = self.__both(result, operand) if self.kind == self.AND else self.__either(result, operand)
+        return result
+
+    def plan(
+            self,
+            lookup: Callable[[tuple], Iterable[int] or None],
+            size: int
+    ) -> Tuple[List[int] or None, "FilterExpression" or None]:
+        if self.kind != self.AND:
+            row_ids = self.__get_row_ids(lookup, size)
+            return (row_ids, None) if row_ids is not None else (None, self)
+
+        row_ids = None
+        residual = []
+        for operand in self.operands:
+            operand_ids = operand.__get_row_ids(lookup, size)
+            if operand_ids is None:
+                residual.append(operand)
+            elif row_ids is None:
+                row_ids = set(operand_ids)
+            else:
+                row_ids.intersection_update(operand_ids)
+        if row_ids is not None:
+            row_ids = sorted(row_ids)
+        if len(residual) == 0:
+            return row_ids, None
+        return row_ids, residual[0] if len(residual) == 1 else FilterExpression(self.AND, residual)
+
+    def __get_row_ids(self, lookup: Callable[[tuple], Iterable[int] or None], size: int) -> List[int] or None:
+        if self.kind == self.CONDITION:
+            row_ids = lookup(self.condition)
+            return None if row_ids is None else list(row_ids)
+
+        operand_ids = []
+        for operand in self.operands:
+            row_ids = operand.__get_row_ids(lookup, size)
+            if row_ids is None:
+                return None
+            operand_ids.append(row_ids)
+        if self.kind == self.NOT:
+            excluded = set(operand_ids[0])
+            return [row_id for row_id in range(size) if row_id not in excluded]
+        result = set(operand_ids[0])
+        for row_ids in operand_ids[1:]:
+            if self.kind == self.AND:
+                result.intersection_update(row_ids)
+            else:
+                result.update(row_ids)
+        return sorted(result)
+
+    @staticmethod
+    def __negate(inner: Callable[[any], bool]) -> Callable[[any], bool]:
+        return lambda vacancy: not inner(vacancy)
+
+    @staticmethod
+    def __both(left: Callable[[any], bool], right: Callable[[any], bool]) -> Callable[[any], bool]:
+        return lambda vacancy: left(vacancy) and right(vacancy)
+
+    @staticmethod
+    def __either(left: Callable[[any], bool], right: Callable[[any], bool]) -> Callable[[any], bool]:
+        return lambda vacancy: left(vacancy) or right(vacancy)
+
+    @staticmethod
+    def __parse_factor(factor: str, parse_condition: Callable[[str], tuple]) -> "FilterExpression":
+        factor = factor.strip()
+        if factor.startswith('!'):
+            return FilterExpression(
+                FilterExpression.NOT,
+                [FilterExpression.from_condition(parse_condition(factor[1:].strip()))]
+            )
+        return FilterExpression.from_condition(parse_condition(factor))
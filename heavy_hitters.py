@@ -0,0 +1,86 @@
+import os
+from typing import Dict, Hashable
+
+
+class CapacityError(BaseException):
+    pass
+
+
+class SpaceSaving:
+    VARIABLE = "VACANCY_HEAVY_HITTERS"
+    CAPACITY = 1000
+
+    def __init__(self, capacity: int = CAPACITY):
+        self.capacity = max(1, capacity)
+        self.total = 0
+        self.counts = {}
+        self.errors = {}
+        self.__buckets = {}
+        self.__min = 0
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.counts
+
+    @staticmethod
+    def capacity_from_environment() -> int or None:
+        value = os.environ.get(SpaceSaving.VARIABLE, "").strip()
+        if value == "":
+            return None
+        try:
+            capacity = int(value)
+        except ValueError:
+            raise CapacityError
+        if capacity < 1:
+            raise CapacityError
+        return capacity
+
+    def add(self, item: Hashable) -> None:
+        self.total += 1
+        count = self.counts.get(item)
+        if count is not None:
+            self.__increment(item, count)
+        elif len(self.counts) < self.capacity:
+            self.__insert(item, 1, 0)
+            self.__min = 1
+        else:
+            self.__replace(item)
+
+    def guaranteed(self, item: Hashable) -> int:
+        return self.counts[item] - self.errors[item]
+
+    def heavy_hitters(self, share: float) -> Dict[Hashable, int]:
+        return {
+            item: self.guaranteed(item) for item in self.counts
+            if self.guaranteed(item) / self.total > share
+        }
+
+    def __increment(self, item: Hashable, count: int) -> None:
+        bucket = self.__buckets[count]
+        del bucket[item]
+        if len(bucket) == 0:
+            del self.__buckets[count]
+            if count == self.__min:
+                self.__min = count + 1
+        self.counts[item] = count + 1
+        self.__buckets.setdefault(count + 1, {})[item] = None
+
+    def __insert(self, item: Hashable, count: int, error: int) -> None:
+        self.counts[item] = count
+        self.errors[item] = error
+        self.__buckets.setdefault(count, {})[item] = None
+
+    def __replace(self, item: Hashable) -> None:
+        count = self.__min
+        bucket = self.__buckets[count]
+        victim = next(iter(bucket))
+        del bucket[victim]
+        del self.counts[victim]
+        del self.errors[victim]
+        if len(bucket) == 0:
+            del self.__buckets[count]
+        self.__insert(item, count + 1, count)
+        if count not in self.__buckets:
+            self.__min = count + 1
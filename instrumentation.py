@@ -0,0 +1,164 @@
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Iterable, Iterator
+
+
+class StageMetrics:
+    def __init__(self):
+        self.time = 0.0
+        self.calls = 0
+        self.rows_in = 0
+        self.rows_out = 0
+        self.rejected = 0
+        self.peak_memory = None
+
+    def to_dict(self) -> dict:
+        return {
+            "time": self.time,
+            "calls": self.calls,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "rejected": self.rejected,
+            "peak_memory": self.peak_memory
+        }
+
+
+class Instrumentation:
+    OUTPUT_VARIABLE = "VACANCY_PROFILE"
+    MEMORY_VARIABLE = "VACANCY_PROFILE_MEMORY"
+    LOG = "log"
+    JSON = "json"
+    __DISABLED = nullcontext()
+
+    def __init__(self, is_enabled: bool = False, trace_memory: bool = False, output: str = LOG):
+        self.is_enabled = is_enabled
+        self.trace_memory = is_enabled and trace_memory
+        self.output = output
+        self.stages = {}
+        self.__stack = []
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @staticmethod
+    def from_environment() -> "Instrumentation":
+        output = os.environ.get(Instrumentation.OUTPUT_VARIABLE, "").strip()
+        return Instrumentation(
+            output != "",
+            os.environ.get(Instrumentation.MEMORY_VARIABLE, "").strip() not in ("", "0"),
+            output
+        )
+
+    def get_metrics(self, name: str) -> StageMetrics:
+        metrics = self.stages.get(name)
+        if metrics is None:
+            metrics = StageMetrics()
+            self.stages[name] = metrics
+        return metrics
+
+    def stage(self, name: str):
+        if not self.is_enabled:
+            return self.__DISABLED
+        return self.__measure(name)
+
+    def wrap(self, name: str, iterable: Iterable) -> Iterable:
+        if not self.is_enabled:
+            return iterable
+        return self.__wrap(name, iter(iterable))
+
+    def timed(self, name: str, function: Callable) -> Callable:
+        if not self.is_enabled:
+            return function
+        metrics = self.get_metrics(name)
+
+        def measured(*args, **kwargs):
+            self.__enter(name)
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                self.__exit()
+            metrics.rows_in += 1
+            if result:
+                metrics.rows_out += 1
+            else:
+                metrics.rejected += 1
+            return result
+
+        return measured
+
+    def count(self, name: str, rows_in: int = 0, rows_out: int = 0, rejected: int = 0) -> None:
+        if not self.is_enabled:
+            return
+        metrics = self.get_metrics(name)
+        metrics.rows_in += rows_in
+        metrics.rows_out += rows_out
+        metrics.rejected += rejected
+
+    def to_dict(self) -> dict:
+        return {
+            "total": sum(metrics.time for metrics in self.stages.values()),
+            "peak_memory": tracemalloc.get_traced_memory()[1] if self.trace_memory else None,
+            "stages": {name: metrics.to_dict() for name, metrics in self.stages.items()}
+        }
+
+    def to_log_line(self) -> str:
+        return " ".join(
+            "{0}={1:.3f}s/{2}->{3}{4}".format(
+                name,
+                metrics.time,
+                metrics.rows_in,
+                metrics.rows_out,
+                "/-{0}".format(metrics.rejected) if metrics.rejected else ""
+            )
+            for name, metrics in self.stages.items()
+        )
+
+    def emit(self) -> None:
+        if not self.is_enabled:
+            return
+        if self.output == self.LOG:
+            print(self.to_log_line(), file=sys.stderr)
+        elif self.output == self.JSON:
+            print(json.dumps(self.to_dict(), ensure_ascii=False), file=sys.stderr)
+        else:
+            with open(self.output, "w", encoding="utf-8") as file:
+                json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+
+    @contextmanager
+    def __measure(self, name: str):
+        self.__enter(name)
+        try:
+            yield
+        finally:
+            self.__exit()
+
+    def __wrap(self, name: str, iterator: Iterator) -> Iterator:
+        metrics = self.get_metrics(name)
+        while True:
+            self.__enter(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.__exit()
+            metrics.rows_out += 1
+            yield item
+
+    def __enter(self, name: str) -> None:
+        self.__stack.append([name, time.perf_counter(), 0.0])
+
+    def __exit(self) -> None:
+        name, start, children = self.__stack.pop()
+        elapsed = time.perf_counter() - start
+        metrics = self.get_metrics(name)
+        metrics.time += elapsed - children
+        metrics.calls += 1
+        if self.__stack:
+            self.__stack[-1][2] += elapsed
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            metrics.peak_memory = peak if metrics.peak_memory is None else max(metrics.peak_memory, peak)
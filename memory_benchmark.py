@@ -0,0 +1,30 @@
+import gc
+from benchmark_tools import load_script, measure, without_slots
+
+
+def load_objects(script, file_name: str) -> tuple:
+    list(script.DataSet(file_name).vacancies_reader)
+    gc.collect()
+    return measure(lambda: list(script.DataSet(file_name).vacancies_reader))
+
+
+file_name = input("Введите название файла: ").strip()
+results = []
+for name, path in (("task5", "task5.py"), ("task5_3", "task5.3.py")):
+    plain, plain_time, plain_memory, plain_peak = load_objects(without_slots(load_script(name + "_plain", path), "Salary", "Vacancy"), file_name)
+    rows = len(plain)
+    del plain
+    gc.collect()
+    objects, objects_time, objects_memory, objects_peak = load_objects(load_script(name, path), file_name)
+    results.append((path, rows, plain_memory, objects_memory))
+    del objects
+
+print("{:<14}{:>10}{:>16}{:>16}{:>12}".format("Скрипт", "Строк", "__dict__, МБ", "__slots__, МБ", "Экономия"))
+for path, rows, plain_memory, objects_memory in results:
+    print("{:<14}{:>10}{:>16.2f}{:>16.2f}{:>11.0%}".format(
+        path,
+        rows,
+        plain_memory / 2 ** 20,
+        objects_memory / 2 ** 20,
+        1 - objects_memory / plain_memory if plain_memory else 0
+    ))
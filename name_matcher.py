@@ -0,0 +1,68 @@
+from collections import deque
+from typing import List, Tuple
+
+
+class NameMatcher:
+    def __init__(self, patterns: List[str], cache_size: int = 65536):
+        self.patterns = list(patterns)
+        self.cache_size = cache_size
+        self.__goto = [{}]
+        self.__fail = [0]
+        self.__output = [()]
+        self.__always = tuple(index for index, pattern in enumerate(self.patterns) if pattern == "")
+        self.__matches = {}
+        for index, pattern in enumerate(self.patterns):
+            if pattern != "":
+                self.__insert(pattern, index)
+        self.__link()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def match(self, text: str) -> Tuple[int, ...]:
+        matches = self.__matches.get(text)
+        if matches is None:
+            if len(self.__matches) >= self.cache_size:
+                self.__matches.clear()
+            matches = self.__scan(text)
+            self.__matches[text] = matches
+        return matches
+
+    def __scan(self, text: str) -> Tuple[int, ...]:
+        goto = self.__goto
+        fail = self.__fail
+        output = self.__output
+        found = set(self.__always)
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return tuple(sorted(found))
+
+    def __insert(self, pattern: str, index: int) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self.__goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.__goto)
+                self.__goto[state][char] = next_state
+                self.__goto.append({})
+                self.__fail.append(0)
+                self.__output.append(())
+            state = next_state
+        self.__output[state] += (index,)
+
+    def __link(self) -> None:
+        queue = deque(self.__goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.__goto[state].items():
+                queue.append(next_state)
+                fail = self.__fail[state]
+                while fail and char not in self.__goto[fail]:
+                    fail = self.__fail[fail]
+                self.__fail[next_state] = self.__goto[fail].get(char, 0)
+                self.__output[next_state] += self.__output[self.__fail[next_state]]
@@ -0,0 +1,93 @@
+import hashlib
+import os
+import pickle
+
+
+class ParseCache:
+    VERSION = 3
+    __SUFFIX = ".pickle"
+
+    def __init__(self, directory: str = ".vacancy_cache", max_size: int = 1024 * 2 ** 20):
+        self.directory = directory
+        self.max_size = max_size
+
+    @staticmethod
+    def fingerprint(file_name: str, namespace: str) -> str:
+        stat = os.stat(file_name)
+        with open(file_name, "rb") as file:
+            header_hash = hashlib.sha1(file.readline()).hexdigest()
+        key = "|".join(map(str, (
+            ParseCache.VERSION,
+            namespace,
+            os.path.abspath(file_name),
+            stat.st_size,
+            stat.st_mtime_ns,
+            header_hash
+        )))
+        return "{0}-{1}".format(
+            ParseCache.__path_prefix(file_name, namespace),
+            hashlib.sha1(key.encode("utf-8")).hexdigest()
+        )
+
+    def contains(self, key: str) -> bool:
+        return os.path.exists(self.__get_path(key))
+
+    def load(self, key: str) -> any:
+        path = self.__get_path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            self.__remove(path)
+            return None
+        os.utime(path)
+        return value
+
+    def save(self, key: str, value: any) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        prefix = key.split("-")[0]
+        for entry in os.listdir(self.directory):
+            if entry.startswith(prefix) and entry != key + self.__SUFFIX:
+                self.__remove(os.path.join(self.directory, entry))
+
+        path = self.__get_path(key)
+        temp_path = "{0}.{1}.tmp".format(path, os.getpid())
+        with open(temp_path, "wb") as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        self.__evict()
+
+    def clear(self) -> None:
+        if os.path.isdir(self.directory):
+            for entry in os.listdir(self.directory):
+                self.__remove(os.path.join(self.directory, entry))
+
+    def __evict(self) -> None:
+        entries = []
+        for entry in os.listdir(self.directory):
+            if entry.endswith(self.__SUFFIX):
+                stat = os.stat(os.path.join(self.directory, entry))
+                entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort()
+        total_size = sum(entry[1] for entry in entries)
+        for _, size, entry in entries[:-1]:
+            if total_size <= self.max_size:
+                break
+            self.__remove(os.path.join(self.directory, entry))
+            total_size -= size
+
+    def __get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.__SUFFIX)
+
+    @staticmethod
+    def __path_prefix(file_name: str, namespace: str) -> str:
+        return hashlib.sha1("{0}|{1}".format(namespace, os.path.abspath(file_name)).encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def __remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
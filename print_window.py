@@ -0,0 +1,37 @@
+import heapq
+from itertools import islice
+from typing import Callable, Iterable, List, Tuple
+
+
+class PrintWindow:
+    def __init__(self, print_range: List[str]):
+        self.start = None
+        self.end = None
+        self.is_valid = False
+        try:
+            bounds = [1] if print_range[0] == '' else [int(x) for x in print_range[:2]]
+        except ValueError:
+            return
+        if min(bounds) < 1:
+            return
+        self.start = bounds[0]
+        self.end = bounds[1] if len(bounds) > 1 else None
+        self.is_valid = True
+
+    @property
+    def is_bounded(self) -> bool:
+        return self.end is not None
+
+    def select(self, rows: Iterable, key: Callable = None, reverse: bool = False) -> Tuple[list, int]:
+        if not self.is_bounded:
+            rows = sorted(rows, key=key, reverse=reverse) if key else list(rows)
+            return rows[self.start - 1:], len(rows)
+
+        limit = max(self.end - 1, 1)
+        if key is None:
+            top = list(islice(rows, limit))
+        elif reverse:
+            top = heapq.nlargest(limit, rows, key=key)
+        else:
+            top = heapq.nsmallest(limit, rows, key=key)
+        return top[self.start - 1:self.end - 1], len(top)
@@ -0,0 +1,182 @@
+import math
+import os
+from typing import Dict, List, Tuple
+
+
+class QuantileModeError(BaseException):
+    pass
+
+
+class ExactQuantiles:
+    def __init__(self):
+        self.values = []
+        self.__is_sorted = True
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, value: float) -> None:
+        self.values.append(value)
+        self.__is_sorted = False
+
+    def merge(self, other: "ExactQuantiles") -> "ExactQuantiles":
+        self.values.extend(other.values)
+        self.__is_sorted = False
+        return self
+
+    def quantile(self, share: float) -> float or None:
+        if len(self.values) == 0:
+            return None
+        if not self.__is_sorted:
+            self.values.sort()
+            self.__is_sorted = True
+        return self.values[min(len(self.values) - 1, max(0, math.ceil(share * len(self.values)) - 1))]
+
+    def copy(self) -> "ExactQuantiles":
+        return ExactQuantiles().merge(self)
+
+    def to_dict(self) -> dict:
+        return {"mode": QuantileSketch.EXACT, "values": self.values}
+
+    @staticmethod
+    def from_dict(state: dict) -> "ExactQuantiles":
+        quantiles = ExactQuantiles()
+        quantiles.values = list(state["values"])
+        quantiles.__is_sorted = False
+        return quantiles
+
+
+class KllSketch:
+    K = 200
+    C = 2 / 3
+
+    def __init__(self, k: int = K):
+        self.k = k
+        self.count = 0
+        self.compactors = []
+        self.__parities = []
+        self.__size = 0
+        self.__max_size = 0
+        self.__grow()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float) -> None:
+        self.compactors[0].append(value)
+        self.count += 1
+        self.__size += 1
+        if self.__size >= self.__max_size:
+            self.__compress()
+
+    def merge(self, other: "KllSketch") -> "KllSketch":
+        while len(self.compactors) < len(other.compactors):
+            self.__grow()
+        for compactor, items in zip(self.compactors, other.compactors):
+            compactor.extend(items)
+        self.count += other.count
+        self.__size = sum(len(compactor) for compactor in self.compactors)
+        while self.__size >= self.__max_size:
+            self.__compress()
+        return self
+
+    def quantile(self, share: float) -> float or None:
+        if self.count == 0:
+            return None
+        weighted = self.__get_weighted()
+        total = sum(weight for _, weight in weighted)
+        target = share * total
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+    def copy(self) -> "KllSketch":
+        return KllSketch.from_dict(self.to_dict())
+
+    def to_dict(self) -> dict:
+        return {
+            "mode": QuantileSketch.SKETCH,
+            "k": self.k,
+            "count": self.count,
+            "compactors": [list(compactor) for compactor in self.compactors],
+            "parities": list(self.__parities)
+        }
+
+    @staticmethod
+    def from_dict(state: dict) -> "KllSketch":
+        sketch = KllSketch(state["k"])
+        while len(sketch.compactors) < len(state["compactors"]):
+            sketch.__grow()
+        sketch.compactors = [list(compactor) for compactor in state["compactors"]]
+        sketch.__parities = list(state["parities"])
+        sketch.count = state["count"]
+        sketch.__size = sum(len(compactor) for compactor in sketch.compactors)
+        return sketch
+
+    def __get_weighted(self) -> List[Tuple[float, int]]:
+        weighted = []
+        for height, compactor in enumerate(self.compactors):
+            weighted.extend((value, 2 ** height) for value in compactor)
+        weighted.sort(key=lambda item: item[0])
+        return weighted
+
+    def __capacity(self, height: int) -> int:
+        return int(math.ceil(self.C ** (len(self.compactors) - height - 1) * self.k)) + 1
+
+    def __grow(self) -> None:
+        self.compactors.append([])
+        self.__parities.append(0)
+        self.__max_size = sum(self.__capacity(height) for height in range(len(self.compactors)))
+
+    def __compress(self) -> None:
+        for height in range(len(self.compactors)):
+            if len(self.compactors[height]) >= self.__capacity(height):
+                if height + 1 >= len(self.compactors):
+                    self.__grow()
+                self.compactors[height + 1].extend(self.__compact(height))
+                self.__size = sum(len(compactor) for compactor in self.compactors)
+                if self.__size < self.__max_size:
+                    break
+
+    def __compact(self, height: int) -> List[float]:
+        compactor = self.compactors[height]
+        compactor.sort()
+        rest = [compactor.pop()] if len(compactor) % 2 else []
+        offset = self.__parities[height]
+        self.__parities[height] = 1 - offset
+        promoted = compactor[offset::2]
+        self.compactors[height] = rest
+        return promoted
+
+
+class QuantileSketch:
+    SKETCH = "sketch"
+    EXACT = "exact"
+    VARIABLE = "VACANCY_QUANTILES"
+    SHARES = (0.1, 0.5, 0.9)
+
+    @staticmethod
+    def mode_from_environment() -> str or None:
+        mode = os.environ.get(QuantileSketch.VARIABLE, "").strip()
+        if mode == "":
+            return None
+        if mode not in (QuantileSketch.SKETCH, QuantileSketch.EXACT):
+            raise QuantileModeError
+        return mode
+
+    @staticmethod
+    def make(mode: str) -> KllSketch or ExactQuantiles:
+        if mode == QuantileSketch.SKETCH:
+            return KllSketch()
+        if mode == QuantileSketch.EXACT:
+            return ExactQuantiles()
+        raise QuantileModeError
+
+    @staticmethod
+    def from_dict(state: Dict[str, any]) -> KllSketch or ExactQuantiles:
+        if state["mode"] == QuantileSketch.SKETCH:
+            return KllSketch.from_dict(state)
+        return ExactQuantiles.from_dict(state)
@@ -0,0 +1,27 @@
+from benchmark_tools import load_script, measure
+
+
+statistics = load_script("task5_3", "task5.3.py")
+file_name = input("Введите название файла: ").strip()
+
+objects, objects_time, objects_memory, objects_peak = measure(
+    lambda: list(statistics.DataSet(file_name).vacancies_reader)
+)
+del objects
+store, store_time, store_memory, store_peak = measure(
+    lambda: statistics.DataSet(file_name, columnar=True).get_store()
+)
+
+print(f"Строк: {len(store)}")
+print("{:<16}{:>12}{:>16}{:>16}{:>14}".format("Режим", "Время, с", "Память, МБ", "Пик, МБ", "Строк/с"))
+for mode, elapsed, memory, peak in (
+        ("Vacancy", objects_time, objects_memory, objects_peak),
+        ("VacancyStore", store_time, store_memory, store_peak)
+):
+    print("{:<16}{:>12.3f}{:>16.2f}{:>16.2f}{:>14.0f}".format(
+        mode,
+        elapsed,
+        memory / 2 ** 20,
+        peak / 2 ** 20,
+        len(store) / elapsed if elapsed else 0
+    ))
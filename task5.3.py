@@ -1,8 +1,23 @@
 import csv
 import codecs
-import re
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from datetime import datetime
-from typing import List, Generator, Dict
+from typing import List, Generator, Dict, Iterable, Tuple
+from vacancy_store import VacancyStore, StringPool
+from parse_cache import ParseCache
+from cleaner import Cleaner
+from chunked_reader import ChunkedReader
+from accumulator import KeyedAccumulator
+from date_parser import DateParser
+from vacancy_file import VacancyFile, VacancyFileError
+from year_splitter import YearSplitter
+from instrumentation import Instrumentation
+from name_matcher import NameMatcher
+from deduplicator import Deduplicator
+from quantile_sketch import QuantileSketch, QuantileModeError
 
 
 class OutOfDataError(BaseException):
@@ -25,53 +40,165 @@ class Translator:
 
 
 class Salary:
-    def __init__(self, salary_property: List[str]):
+    __slots__ = ("salary_from", "salary_to", "salary_gross", "salary_currency")
+
+    def __init__(self, salary_property: List[str], pool: StringPool = None):
+        intern = pool.intern if pool is not None else str
         self.salary_from = float(salary_property[0])
         self.salary_to = float(salary_property[1])
         if len(salary_property) == 4:
-            self.salary_gross = salary_property[2]
-            self.salary_currency = salary_property[3]
+            self.salary_gross = intern(salary_property[2])
+            self.salary_currency = intern(salary_property[3])
         else:
-            self.salary_currency = salary_property[2]
+            self.salary_currency = intern(salary_property[2])
 
     def get_salary(self) -> float:
         return (self.salary_from + self.salary_to) / 2 * Translator.currency_to_rub[self.salary_currency]
 
 
 class Vacancy:
-    def __init__(self, property_list: List[any], headline: List[str]):
+    __slots__ = (
+        "name",
+        "description",
+        "key_skills",
+        "experience_id",
+        "premium",
+        "employer_name",
+        "salary",
+        "area_name",
+        "published_at"
+    )
+    __date_parser = DateParser()
+
+    def __init__(self, property_list: List[any], headline: List[str], pool: StringPool = None):
+        intern = pool.intern if pool is not None else str
         if len(headline) == 12:
             self.name = property_list[0]
             self.description = property_list[1]
             self.key_skills = property_list[2] if type(property_list[2]) == list else [property_list[2]]
-            self.experience_id = property_list[3]
-            self.premium = property_list[4]
-            self.employer_name = property_list[5]
-            self.salary = Salary(property_list[6:10])
-            self.area_name = property_list[10]
-            self.published_at = datetime.strptime(property_list[11], "%Y-%m-%dT%H:%M:%S%z")
+            self.experience_id = intern(property_list[3])
+            self.premium = intern(property_list[4])
+            self.employer_name = intern(property_list[5])
+            self.salary = Salary(property_list[6:10], pool)
+            self.area_name = intern(property_list[10])
+            self.published_at = self.__parse_date(property_list[11])
         elif len(headline) == 6:
             self.name = property_list[0]
-            self.salary = Salary(property_list[1:4])
-            self.area_name = property_list[4]
-            self.published_at = datetime.strptime(property_list[5], "%Y-%m-%dT%H:%M:%S%z")
+            self.salary = Salary(property_list[1:4], pool)
+            self.area_name = intern(property_list[4])
+            self.published_at = self.__parse_date(property_list[5])
+
+    def __parse_date(self, published_at: str or datetime) -> datetime:
+        if isinstance(published_at, datetime):
+            return published_at
+        return self.__date_parser.parse(published_at)
 
 
 class DataSet:
-    __CLEANER = re.compile('<.*?>')
-    __SPACE_CLEANER = re.compile('(\s\s+)|(\xa0)')
+    STATISTICS_COLUMNS = ("name", "salary_from", "salary_to", "salary_currency", "area_name", "published_at")
+    __CLEANER = Cleaner()
+    __YEAR_PARSER = DateParser(DateParser.YEAR)
+    __CACHE_NAMESPACE = "task5.3"
 
-    def __init__(self, file_name: str):
+    def __init__(
+            self,
+            file_name: str,
+            columnar: bool = False,
+            cache: ParseCache = None,
+            byte_range: tuple = None,
+            columns: tuple = None,
+            instrumentation: Instrumentation = None,
+            deduplicator: Deduplicator = None
+    ):
         self.file_name = file_name
         self.headline = []
-        self.vacancies_reader = self.__clean_properties(
-            vacancies=self.__reader(file_name=file_name)
+        self.store = None
+        self.columnar = columnar
+        self.columns = columns
+        self.deduplicator = deduplicator
+        self.pool = StringPool()
+        self.instrumentation = instrumentation or Instrumentation()
+        self.cache = cache if byte_range is None else None
+        self.is_binary = file_name.endswith(VacancyFile.EXTENSION)
+        if self.is_binary:
+            self.store = VacancyFile.open(file_name)
+            self.headline = self.store.headline
+            self.columnar = True
+            self.cache = None
+            self.__rows = None
+            if deduplicator is not None:
+                with self.instrumentation.stage("dedup"):
+                    self.store = VacancyStore.from_rows(
+                        self.headline,
+                        deduplicator.filter(self.store.rows(), self.headline)
+                    )
+        else:
+            self.__rows = self.instrumentation.wrap("clean", self.__clean_properties(
+                vacancies=self.instrumentation.wrap("read", self.__reader(file_name=file_name, byte_range=byte_range))
+            ))
+            if deduplicator is not None:
+                self.__rows = self.instrumentation.wrap("dedup", deduplicator.filter(self.__rows, self.headline))
+        self.vacancies_reader = self.__make_vacancies()
+
+    def __make_vacancies(self) -> Generator[Vacancy, None, None]:
+        if not self.columnar:
+            for row in self.__rows:
+                yield Vacancy(row, self.headline, self.pool)
+            return
+        store = self.get_store()
+        for row in store.rows():
+            yield Vacancy(row, store.headline, self.pool)
+
+    def get_store(self) -> VacancyStore:
+        if self.store is not None:
+            if self.is_binary and len(self.store) == 0:
+                raise OutOfDataError
+            return self.store
+        if self.cache is None:
+            self.store = self.__make_store()
+            return self.store
+
+        with self.instrumentation.stage("cache"):
+            self.store = self.cache.load(self.cache.fingerprint(self.file_name, self.__get_namespace()))
+        if self.store is None:
+            self.set_store(self.__make_store())
+        return self.store
+
+    def set_store(self, store: VacancyStore) -> None:
+        self.store = store
+        if self.cache is not None:
+            with self.instrumentation.stage("cache"):
+                self.cache.save(self.cache.fingerprint(self.file_name, self.__get_namespace()), store)
+
+    def __make_store(self) -> VacancyStore:
+        with self.instrumentation.stage("store"):
+            if self.columns is None:
+                return VacancyStore.from_rows(self.headline, self.__rows)
+            indexes = [self.headline.index(column) for column in self.columns if column in self.headline]
+            return VacancyStore.from_rows(
+                [self.headline[index] for index in indexes],
+                ([row[index] for index in indexes] for row in self.__rows)
+            )
+
+    def __get_namespace(self) -> str:
+        namespace = self.__CACHE_NAMESPACE
+        if self.columns is not None:
+            namespace = "{0}:{1}".format(namespace, ",".join(self.columns))
+        if self.deduplicator is not None:
+            namespace = "{0}:{1}".format(namespace, self.deduplicator.get_namespace())
+        return namespace
+
+    def is_cached(self) -> bool:
+        return self.cache is not None and self.cache.contains(
+            self.cache.fingerprint(self.file_name, self.__get_namespace())
         )
 
-    def __reader(self, file_name: str) -> csv.reader:
+    def __reader(self, file_name: str, byte_range: tuple = None) -> csv.reader:
         reader = csv.reader(codecs.open(file_name, "r", "utf_8_sig"), delimiter=',')
         self.headline = reader.__next__()
-        return reader
+        if byte_range is None:
+            return reader
+        return csv.reader(ChunkedReader.read_lines(file_name, *byte_range), delimiter=',')
 
     def __validate(self, element: List[str]) -> bool:
         if len(element) != len(self.headline):
@@ -81,120 +208,376 @@ class DataSet:
                 return False
         return True
 
-    def __clean_properties(self, vacancies: csv.reader) -> Generator[Vacancy, None, None]:
+    def __clean_properties(self, vacancies: csv.reader) -> Generator[List[str], None, None]:
         i = 0
         key_skills_index = self.headline.index("key_skills") if "key_skills_index" in self.headline else -1
+        key = self.deduplicator.key if self.deduplicator is not None else ()
+        projected = [self.columns is None or column in self.columns or column in key for column in self.headline]
+        validate = self.instrumentation.timed("validate", self.__validate)
         for vacancy in vacancies:
             i += 1
             clean_vacancy = []
-            if self.__validate(element=vacancy):
+            if validate(element=vacancy):
                 for merit_index in range(len(vacancy)):
-                    if merit_index == key_skills_index:
+                    column = self.headline[merit_index] if merit_index < len(self.headline) else None
+                    if not projected[merit_index]:
+                        temp_property = vacancy[merit_index]
+                    elif merit_index == key_skills_index:
                         temp_property = vacancy[merit_index].split('\n')
                         for i in range(len(temp_property)):
-                            temp_property[i] = re.sub(self.__CLEANER, '', temp_property[i])
-                            temp_property[i] = re.sub(self.__SPACE_CLEANER, ' ', temp_property[i]).strip()
+                            temp_property[i] = self.__CLEANER.clean(temp_property[i], column).strip()
                     else:
-                        temp_property = re.sub(self.__CLEANER, '', vacancy[merit_index])
-                        temp_property = re.sub(self.__SPACE_CLEANER, ' ', temp_property).strip()
+                        temp_property = self.__CLEANER.clean(vacancy[merit_index], column).strip()
                     clean_vacancy.append(temp_property)
-                yield Vacancy(clean_vacancy, self.headline)
+                yield clean_vacancy
         if i == 0:
             raise OutOfDataError
 
+    def get_rows(self) -> Generator[List[any], None, None]:
+        if not self.columnar:
+            return self.__rows
+        return self.get_store().rows()
+
+    @staticmethod
+    def to_statistics_rows(rows: Iterable[List[any]], headline: List[str]) -> Generator[tuple, None, None]:
+        published_at, salary_from, salary_to, salary_currency, area_name, name = map(
+            headline.index,
+            ("published_at", "salary_from", "salary_to", "salary_currency", "area_name", "name")
+        )
+        for row in rows:
+            yield (
+                DataSet.__YEAR_PARSER.parse(row[published_at]),
+                (float(row[salary_from]) + float(row[salary_to])) / 2
+                * Translator.currency_to_rub[row[salary_currency]],
+                row[area_name],
+                row[name]
+            )
+
+    def get_statistics_rows(self) -> Generator[tuple, None, None]:
+        if not self.columnar:
+            yield from self.to_statistics_rows(self.__rows, self.headline)
+            return
+        store = self.get_store()
+        rates = [Translator.currency_to_rub[currency] for currency in store.pools["salary_currency"].values]
+        yield from zip(
+            store.years(),
+            map(
+                lambda salary_from, salary_to, currency: (salary_from + salary_to) / 2 * rates[currency],
+                store.columns["salary_from"],
+                store.columns["salary_to"],
+                store.columns["salary_currency"]
+            ),
+            store.decoded("area_name"),
+            store.decoded("name")
+        )
+
 
 class InputConnect:
+    PARALLEL_MIN_SIZE = 16 * 2 ** 20
+    PROFESSIONS_PREFIX = "@"
+    __CHUNKS_PER_WORKER = 4
+    __STATISTICS = ("by_year", "by_city", "profession_by_year", "by_profession")
+    __STATISTICS_NAMESPACE = "task5.3-statistics:"
+
     def __init__(
             self,
             filename,
-            filter_parameter
+            filter_parameter,
+            columnar: bool = False,
+            cache: ParseCache = None,
+            workers: int = 1,
+            instrumentation: Instrumentation = None,
+            professions: List[str] = None,
+            deduplicator: Deduplicator = None,
+            quantiles: str = None
     ):
-        self.__vacancies = DataSet(file_name=filename.strip())
+        self.__instrumentation = instrumentation or Instrumentation()
+        self.__deduplicator = deduplicator
+        self.__quantiles = quantiles
+        self.__partitions = YearSplitter.get_partitions(filename.strip()) if os.path.isdir(filename.strip()) else None
+        self.__vacancies = None if self.__partitions is not None else DataSet(
+            file_name=filename.strip(),
+            columnar=columnar,
+            cache=cache,
+            columns=DataSet.STATISTICS_COLUMNS,
+            instrumentation=self.__instrumentation,
+            deduplicator=deduplicator
+        )
         self.__filter_parameter = filter_parameter.strip()
+        self.__professions = [profession.strip() for profession in professions] if professions else None
+        self.__workers = workers
         self.all_salary_level = {}
         self.all_vacancies_count = {}
         self.salary_level = {}
         self.vacancies_count = {}
+        self.professions_salary_level = {}
+        self.professions_vacancies_count = {}
+        self.professions_salary_quantiles = {}
         self.by_city_level = {}
         self.vacancies_part = {}
+        self.all_salary_quantiles = {}
+        self.salary_quantiles = {}
+        self.by_city_quantiles = {}
         self.__get_statistics()
 
     def __get_statistics(self) -> None:
-        temp_by_city_count = {}
-        temp_by_city_level = {}
-        temp_all_by_city_count = {}
-        for vacancy in self.__vacancies.vacancies_reader:
-            vacancy_year = vacancy.published_at.year
-            vacancy_salary = vacancy.salary.get_salary()
-            self.__add_to_or_update(
-                self.all_salary_level,
-                vacancy_year,
-                vacancy_salary
-            )
-            self.__add_to_or_update(
-                self.all_vacancies_count,
-                vacancy_year,
-                1
-            )
-            self.__add_to_or_update(
-                temp_by_city_level,
-                vacancy.area_name,
-                vacancy_salary
-            )
-            self.__add_to_or_update(
-                temp_all_by_city_count,
-                vacancy.area_name,
-                1
-            )
-            if self.__filter_parameter in vacancy.name:
-                self.__add_to_or_update(
-                    self.salary_level,
-                    vacancy_year,
-                    vacancy_salary
-                )
-                self.__add_to_or_update(
-                    self.vacancies_count,
-                    vacancy_year,
-                    1
-                )
-                self.__add_to_or_update(
-                    temp_by_city_count,
-                    vacancy.area_name,
-                    1
-                )
-        self.all_salary_level = {key: int(value / self.all_vacancies_count[key]) for key, value in self.all_salary_level.items()}
-        self.salary_level = {key: int(value / self.vacancies_count[key]) for key, value in self.salary_level.items()}
+        instrumentation = self.__instrumentation
+        with instrumentation.stage("cache"):
+            statistics = self.__load_statistics()
+        if statistics is None:
+            with instrumentation.stage("aggregate"):
+                if self.__partitions is not None:
+                    statistics = self.__get_partition_statistics()
+                elif self.__is_parallel():
+                    statistics = self.__get_parallel_statistics()
+                else:
+                    statistics = self.collect_statistics(
+                        instrumentation.wrap("statistics", self.__vacancies.get_statistics_rows()),
+                        self.__filter_parameter,
+                        matcher=NameMatcher(self.__professions) if self.__professions else None,
+                        quantiles=self.__quantiles
+                    )
+            if self.__deduplicator is not None:
+                instrumentation.count("dedup", rejected=self.__deduplicator.duplicates)
+                self.__deduplicator.close()
+            with instrumentation.stage("cache"):
+                self.__save_statistics(statistics)
+        with instrumentation.stage("summary"):
+            self.__summarize(statistics)
+
+    def __summarize(self, statistics: Dict[str, KeyedAccumulator]) -> None:
+        self.all_salary_level = statistics["by_year"].truncated_means()
+        self.all_vacancies_count = statistics["by_year"].counts()
+        self.salary_level = statistics["profession_by_year"].truncated_means()
+        self.vacancies_count = statistics["profession_by_year"].counts()
 
         if len(self.salary_level) == 0:
             self.salary_level = {key: 0 for key in self.all_vacancies_count.keys()}
             self.vacancies_count = {key: 0 for key in self.all_vacancies_count.keys()}
 
-        f = sum(temp_all_by_city_count.values())
+        if self.__professions:
+            self.__summarize_professions(statistics["by_profession"])
+
+        by_city_count = statistics["by_city"].counts()
+        by_city_level = statistics["by_city"].truncated_means()
+        f = sum(by_city_count.values())
         self.vacancies_part = dict(sorted(
-            [(key, float("{:.4f}".format(value / f))) for key, value in temp_all_by_city_count.items() if value / f >= 0.01],
+            [(key, float("{:.4f}".format(value / f))) for key, value in by_city_count.items() if value / f >= 0.01],
             key=lambda e: e[1],
             reverse=True
         ))
         self.by_city_level = dict(sorted(
-            [(key, int(temp_by_city_level[key] / temp_all_by_city_count[key])) for key in self.vacancies_part.keys()],
+            [(key, by_city_level[key]) for key in self.vacancies_part.keys()],
             key=lambda e: (e[1], -len(e[0])),
             reverse=True
         ))
 
-    def print_self(self) -> None:
-        print(f"Динамика уровня зарплат по годам: {self.all_salary_level}")
-        print(f"Динамика количества вакансий по годам: {self.all_vacancies_count}")
-        print(f"Динамика уровня зарплат по годам для выбранной профессии: {self.salary_level}")
-        print(f"Динамика количества вакансий по годам для выбранной профессии: {self.vacancies_count}")
-        print(f"Уровень зарплат по городам (в порядке убывания): {self.__slice_dict(self.by_city_level, 10)}")
-        print(f"Доля вакансий по городам (в порядке убывания): {self.__slice_dict(self.vacancies_part, 10)}")
+        if self.__quantiles:
+            self.__summarize_quantiles(statistics)
+
+    def __summarize_quantiles(self, statistics: Dict[str, KeyedAccumulator]) -> None:
+        self.all_salary_quantiles = statistics["by_year"].truncated_quantiles()
+        self.salary_quantiles = statistics["profession_by_year"].truncated_quantiles()
+        if len(self.salary_quantiles) == 0:
+            self.salary_quantiles = {key: (0, 0, 0) for key in self.all_vacancies_count.keys()}
+        by_city_quantiles = statistics["by_city"].truncated_quantiles()
+        self.by_city_quantiles = {key: by_city_quantiles[key] for key in self.by_city_level.keys()}
+        if not self.__professions:
+            return
+        professions_quantiles = [{} for _ in self.__professions]
+        for (index, vacancy_year), quantiles in statistics["by_profession"].truncated_quantiles().items():
+            professions_quantiles[index][vacancy_year] = quantiles
+        for profession, quantiles in zip(self.__professions, professions_quantiles):
+            if len(quantiles) == 0:
+                quantiles = {key: (0, 0, 0) for key in self.all_vacancies_count.keys()}
+            self.professions_salary_quantiles[profession] = quantiles
+
+    def __summarize_professions(self, by_profession: KeyedAccumulator) -> None:
+        salary_levels = [{} for _ in self.__professions]
+        vacancies_counts = [{} for _ in self.__professions]
+        for (index, vacancy_year), salary_level in by_profession.truncated_means().items():
+            salary_levels[index][vacancy_year] = salary_level
+        for (index, vacancy_year), vacancies_count in by_profession.counts().items():
+            vacancies_counts[index][vacancy_year] = vacancies_count
+        for profession, salary_level, vacancies_count in zip(self.__professions, salary_levels, vacancies_counts):
+            if len(salary_level) == 0:
+                salary_level = {key: 0 for key in self.all_vacancies_count.keys()}
+                vacancies_count = {key: 0 for key in self.all_vacancies_count.keys()}
+            self.professions_salary_level[profession] = salary_level
+            self.professions_vacancies_count[profession] = vacancies_count
+
+    @staticmethod
+    def read_professions(string: str) -> List[str] or None:
+        if not string.strip().startswith(InputConnect.PROFESSIONS_PREFIX):
+            return None
+        with open(string.strip()[len(InputConnect.PROFESSIONS_PREFIX):].strip(), encoding="utf_8_sig") as file:
+            return [line.strip() for line in file if line.strip() != ""]
+
+    def __is_parallel(self) -> bool:
+        return self.__workers > 1 \
+            and self.__deduplicator is None \
+            and not self.__vacancies.is_binary \
+            and os.path.getsize(self.__vacancies.file_name) >= self.PARALLEL_MIN_SIZE \
+            and not self.__vacancies.is_cached()
+
+    def __get_parallel_statistics(self) -> Dict[str, KeyedAccumulator]:
+        file_name = self.__vacancies.file_name
+        ranges = ChunkedReader.split(file_name, self.__workers * self.__CHUNKS_PER_WORKER)
+        if len(ranges) == 0:
+            raise OutOfDataError
+        is_stored = self.__vacancies.columnar and self.__vacancies.cache is not None
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            partials = list(executor.map(
+                get_range_statistics,
+                repeat(file_name),
+                repeat(self.__filter_parameter),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+                repeat(self.__professions),
+                repeat(self.__quantiles),
+                repeat(is_stored)
+            ))
+        if is_stored:
+            with self.__instrumentation.stage("store"):
+                store = VacancyStore.concat([store for _, store in partials])
+            self.__vacancies.set_store(store)
+        return self.merge_statistics([statistics for statistics, _ in partials])
+
+    def __get_partition_statistics(self) -> Dict[str, KeyedAccumulator]:
+        if len(self.__partitions) == 0:
+            raise OutOfDataError
+        if self.__deduplicator is not None:
+            partials = [self.__get_deduplicated_statistics()]
+        elif self.__workers > 1:
+            with ProcessPoolExecutor(max_workers=min(self.__workers, len(self.__partitions))) as executor:
+                partials = list(executor.map(
+                    get_partition_statistics,
+                    self.__partitions,
+                    repeat(self.__filter_parameter),
+                    repeat(self.__professions),
+                    repeat(self.__quantiles)
+                ))
+        else:
+            partials = [
+                get_partition_statistics(partition, self.__filter_parameter, self.__professions, self.__quantiles)
+                for partition in self.__partitions
+            ]
+        statistics = self.merge_statistics(partials)
+        for keyed in statistics.values():
+            keyed.sort_by_position()
+        return statistics
+
+    def __get_deduplicated_statistics(self) -> Dict[str, KeyedAccumulator]:
+        columns = DataSet.STATISTICS_COLUMNS + tuple(
+            column for column in self.__deduplicator.key if column not in DataSet.STATISTICS_COLUMNS
+        )
+        data_sets = [
+            DataSet(file_name=partition, columns=columns)
+            for partition in self.__partitions
+        ]
+        rows = heapq.merge(*(
+            zip(YearSplitter.read_positions(partition), data_set.get_rows())
+            for partition, data_set in zip(self.__partitions, data_sets)
+        ))
+        headline = data_sets[0].headline
+        return self.collect_statistics(
+            DataSet.to_statistics_rows(self.__deduplicator.filter((row for _, row in rows), headline), headline),
+            self.__filter_parameter,
+            matcher=NameMatcher(self.__professions) if self.__professions else None,
+            quantiles=self.__quantiles
+        )
+
+    def __load_statistics(self) -> Dict[str, KeyedAccumulator] or None:
+        cache = self.__get_statistics_cache()
+        if cache is None:
+            return None
+        state = cache.load(cache.fingerprint(self.__vacancies.file_name, self.__get_namespace()))
+        if state is None:
+            return None
+        return {name: KeyedAccumulator.from_list(state.get(name, [])) for name in self.__STATISTICS}
+
+    def __save_statistics(self, statistics: Dict[str, KeyedAccumulator]) -> None:
+        cache = self.__get_statistics_cache()
+        if cache is None:
+            return
+        cache.save(
+            cache.fingerprint(self.__vacancies.file_name, self.__get_namespace()),
+            {name: statistics[name].to_list() for name in self.__STATISTICS}
+        )
+
+    def __get_statistics_cache(self) -> ParseCache or None:
+        if self.__vacancies is None or self.__quantiles == QuantileSketch.EXACT:
+            return None
+        return self.__vacancies.cache
+
+    def __get_namespace(self) -> str:
+        namespace = self.__STATISTICS_NAMESPACE + self.__filter_parameter
+        if self.__deduplicator is not None:
+            namespace = "{0}:{1}".format(self.__deduplicator.get_namespace(), namespace)
+        if self.__quantiles:
+            namespace = "quantiles:{0}:{1}".format(self.__quantiles, namespace)
+        if not self.__professions:
+            return namespace
+        return "\n".join([namespace] + self.__professions)
+
+    @staticmethod
+    def collect_statistics(
+            rows: Generator[tuple, None, None],
+            filter_parameter: str,
+            positions: Iterable[int] = None,
+            matcher: NameMatcher = None,
+            quantiles: str = None
+    ) -> Dict[str, KeyedAccumulator]:
+        statistics = {name: KeyedAccumulator(quantiles) for name in InputConnect.__STATISTICS}
+        by_year = statistics["by_year"]
+        by_city = statistics["by_city"]
+        profession_by_year = statistics["profession_by_year"]
+        by_profession = statistics["by_profession"]
+        for (vacancy_year, vacancy_salary, area_name, name), position in zip(rows, positions or repeat(None)):
+            by_year.add(vacancy_year, vacancy_salary, position)
+            by_city.add(area_name, vacancy_salary, position)
+            if matcher is not None:
+                for index in matcher.match(name):
+                    by_profession.add((index, vacancy_year), vacancy_salary, position)
+            elif filter_parameter in name:
+                profession_by_year.add(vacancy_year, vacancy_salary, position)
+        return statistics
 
     @staticmethod
-    def __add_to_or_update(dictionary: Dict[any, any], key: any, value: any) -> None:
-        if dictionary.__contains__(key):
-            dictionary[key] += value
+    def merge_statistics(partials: List[Dict[str, KeyedAccumulator]]) -> Dict[str, KeyedAccumulator]:
+        statistics = {name: KeyedAccumulator() for name in InputConnect.__STATISTICS}
+        for partial in partials:
+            for name, keyed in partial.items():
+                statistics[name].merge(keyed)
+        return statistics
+
+    def print_self(self) -> None:
+        with self.__instrumentation.stage("render"):
+            print(f"Динамика уровня зарплат по годам: {self.all_salary_level}")
+            print(f"Динамика количества вакансий по годам: {self.all_vacancies_count}")
+            if self.__professions:
+                for profession in self.professions_salary_level:
+                    print(f"Динамика уровня зарплат по годам для профессии «{profession}»: "
+                          f"{self.professions_salary_level[profession]}")
+                    print(f"Динамика количества вакансий по годам для профессии «{profession}»: "
+                          f"{self.professions_vacancies_count[profession]}")
+            else:
+                print(f"Динамика уровня зарплат по годам для выбранной профессии: {self.salary_level}")
+                print(f"Динамика количества вакансий по годам для выбранной профессии: {self.vacancies_count}")
+            print(f"Уровень зарплат по городам (в порядке убывания): {self.__slice_dict(self.by_city_level, 10)}")
+            print(f"Доля вакансий по городам (в порядке убывания): {self.__slice_dict(self.vacancies_part, 10)}")
+            if self.__quantiles:
+                self.__print_quantiles()
+
+    def __print_quantiles(self) -> None:
+        print(f"Квантили зарплат по годам (p10, медиана, p90): {self.all_salary_quantiles}")
+        if self.__professions:
+            for profession in self.professions_salary_quantiles:
+                print(f"Квантили зарплат по годам для профессии «{profession}» (p10, медиана, p90): "
+                      f"{self.professions_salary_quantiles[profession]}")
         else:
-            dictionary.update({key: value})
+            print(f"Квантили зарплат по годам для выбранной профессии (p10, медиана, p90): {self.salary_quantiles}")
+        print(f"Квантили зарплат по городам (p10, медиана, p90): {self.__slice_dict(self.by_city_quantiles, 10)}")
 
     @staticmethod
     def __slice_dict(dictionary: dict, end: int):
@@ -209,19 +592,76 @@ class InputConnect:
         return result
 
 
-try:
-    input_connect = InputConnect(
-        input("Введите название файла: "),
-        input("Введите название профессии: ")
+def get_range_statistics(
+        file_name: str,
+        filter_parameter: str,
+        start: int,
+        end: int,
+        professions: List[str] = None,
+        quantiles: str = None,
+        columnar: bool = False
+) -> Tuple[Dict[str, KeyedAccumulator], VacancyStore or None]:
+    data_set = DataSet(
+        file_name=file_name,
+        columnar=columnar,
+        byte_range=(start, end),
+        columns=DataSet.STATISTICS_COLUMNS
+    )
+    statistics = InputConnect.collect_statistics(
+        data_set.get_statistics_rows(),
+        filter_parameter,
+        matcher=NameMatcher(professions) if professions else None,
+        quantiles=quantiles
+    )
+    return statistics, data_set.store
+
+
+def get_partition_statistics(
+        file_name: str,
+        filter_parameter: str,
+        professions: List[str] = None,
+        quantiles: str = None
+) -> Dict[str, KeyedAccumulator]:
+    data_set = DataSet(file_name=file_name, columns=DataSet.STATISTICS_COLUMNS)
+    return InputConnect.collect_statistics(
+        data_set.get_statistics_rows(),
+        filter_parameter,
+        YearSplitter.read_positions(file_name),
+        NameMatcher(professions) if professions else None,
+        quantiles
     )
-    input_connect.print_self()
-except StopIteration:
-    print("Пустой файл")
-except IOError:
-    print("Формат ввода некорректен")
-except KeyError:
-    print("Параметр поиска некорректен")
-except AssertionError:
-    print("Ничего не найдено")
-except OutOfDataError:
-    print("Нет данных")
+
+
+if __name__ == "__main__":
+    instrumentation = Instrumentation.from_environment()
+    try:
+        file_name = input("Введите название файла: ")
+        profession = input("Введите название профессии: ")
+        professions = InputConnect.read_professions(profession)
+        input_connect = InputConnect(
+            file_name,
+            "" if professions else profession,
+            columnar=True,
+            cache=ParseCache(),
+            workers=os.cpu_count() or 1,
+            instrumentation=instrumentation,
+            professions=professions,
+            deduplicator=Deduplicator.from_environment(),
+            quantiles=QuantileSketch.mode_from_environment()
+        )
+        input_connect.print_self()
+    except StopIteration:
+        print("Пустой файл")
+    except IOError:
+        print("Формат ввода некорректен")
+    except KeyError:
+        print("Параметр поиска некорректен")
+    except AssertionError:
+        print("Ничего не найдено")
+    except OutOfDataError:
+        print("Нет данных")
+    except VacancyFileError:
+        print("Формат файла некорректен")
+    except QuantileModeError:
+        print("Режим квантилей задан некорректно")
+    instrumentation.emit()
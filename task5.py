@@ -1,9 +1,18 @@
 import csv
 import codecs
-import re
+import json
 from datetime import datetime
 from prettytable import PrettyTable
-from typing import List, Generator, Callable
+from typing import List, Generator, Callable, Tuple, Iterable
+from vacancy_store import VacancyStore, StringPool
+from vacancy_index import TextIndex
+from parse_cache import ParseCache
+from cleaner import Cleaner
+from date_parser import DateParser
+from print_window import PrintWindow
+from vacancy_file import VacancyFile, VacancyFileError
+from filter_expression import FilterExpression
+from instrumentation import Instrumentation
 
 
 class SortParameterError(BaseException):
@@ -45,7 +54,8 @@ class Translator:
         "Название": "name",
         "Название региона": "area_name",
         "Компания": "employer_name",
-        "Описание": "description"
+        "Описание": "description",
+        "Поиск": "text"
     }
     translation_experience = {
         "noExperience": "Нет опыта",
@@ -82,11 +92,14 @@ class Translator:
 
 
 class Salary:
-    def __init__(self, salary_property: List[str]):
+    __slots__ = ("salary_from", "salary_to", "salary_gross", "salary_currency")
+
+    def __init__(self, salary_property: List[str], pool: StringPool = None):
+        intern = pool.intern if pool is not None else str
         self.salary_from = salary_property[1]
         self.salary_to = salary_property[2]
-        self.salary_gross = salary_property[3]
-        self.salary_currency = salary_property[4]
+        self.salary_gross = intern(salary_property[3])
+        self.salary_currency = intern(salary_property[4])
 
     def __str__(self):
         return "{0} - {1} ({2}) ({3})".format(
@@ -102,41 +115,55 @@ class Salary:
 
 
 class Vacancy:
+    __slots__ = (
+        "name",
+        "description",
+        "key_skills",
+        "experience_id",
+        "premium",
+        "employer_name",
+        "salary",
+        "area_name",
+        "published_at"
+    )
+    DISPLAY_LENGTH = 100
     __formatter = {
-        lambda row: row.__setattr__("description", row.description.strip()),
-        lambda row: row.__setattr__("key_skills", "\n".join(row.key_skills)),
-        lambda row: row.__setattr__("premium", Translator.translation_premium[row.premium.capitalize()]),
-        lambda row: row.__setattr__("experience_id", Translator.translation_experience[row.experience_id]),
-        lambda row: row.__setattr__("published_at", datetime.strftime(row.published_at, "%d.%m.%Y"))
+        "description": lambda value: value.strip(),
+        "key_skills": lambda value: "\n".join(value),
+        "premium": lambda value: Translator.translation_premium[value.capitalize()],
+        "experience_id": lambda value: Translator.translation_experience[value],
+        "published_at": lambda value: datetime.strftime(value, "%d.%m.%Y")
     }
+    __date_parser = DateParser()
 
-    def __init__(self, property_list: List[any]):
+    def __init__(self, property_list: List[any], pool: StringPool = None):
+        intern = pool.intern if pool is not None else str
         self.name = property_list[0]
         self.description = property_list[1]
         self.key_skills = property_list[2] if type(property_list[2]) == list else [property_list[2]]
-        self.experience_id = property_list[3]
-        self.premium = property_list[4]
-        self.employer_name = property_list[5]
-        self.salary = Salary(property_list[5:10])
-        self.area_name = property_list[10]
-        self.published_at = datetime.strptime(property_list[11], "%Y-%m-%dT%H:%M:%S%z")
+        self.experience_id = intern(property_list[3])
+        self.premium = intern(property_list[4])
+        self.employer_name = intern(property_list[5])
+        self.salary = Salary(property_list[5:10], pool)
+        self.area_name = intern(property_list[10])
+        self.published_at = property_list[11] if isinstance(property_list[11], datetime) \
+            else self.__date_parser.parse(property_list[11])
 
     def make_table_row(self) -> List[any]:
         result = []
-        for formatting in self.__formatter:
-            formatting(self)
-
-        for attribute in self.__dict__:
+        for attribute in self.__slots__:
             attribute_value = self.__getattribute__(attribute)
-            if len(attribute_value.__str__()) > 100:
-                attribute_value = attribute_value.__str__()[:100] + "..."
+            if attribute in self.__formatter:
+                attribute_value = self.__formatter[attribute](attribute_value)
+            if len(attribute_value.__str__()) > self.DISPLAY_LENGTH:
+                attribute_value = attribute_value.__str__()[:self.DISPLAY_LENGTH] + "..."
             result.append(attribute_value)
         return result
 
 
 class DataSet:
-    __CLEANER = re.compile('<.*?>')
-    __SPACE_CLEANER = re.compile('(\s\s+)|(\xa0)')
+    __CLEANER = Cleaner()
+    __CACHE_NAMESPACE = "task5"
     __sorter = {
         "Навыки": lambda to_sort:
         len(to_sort.key_skills),
@@ -159,16 +186,111 @@ class DataSet:
         to_sort.published_at
     }
 
-    def __init__(self, file_name: str):
+    def __init__(
+            self,
+            file_name: str,
+            columnar: bool = False,
+            cache: ParseCache = None,
+            store: VacancyStore = None,
+            instrumentation: Instrumentation = None,
+            deferred: Iterable[str] = ()
+    ):
         self.file_name = file_name
-        self.vacancies_reader = self.__clean_properties(
-            vacancies=self.__reader(file_name=file_name)
-        )
-
-    @staticmethod
-    def __reader(file_name: str) -> csv.reader:
+        self.headline = []
+        self.store = None
+        self.columnar = columnar
+        self.cache = cache
+        self.pool = StringPool()
+        self.instrumentation = instrumentation or Instrumentation()
+        self.is_binary = file_name.endswith(VacancyFile.EXTENSION)
+        if store is not None or self.is_binary:
+            self.store = store if store is not None else VacancyFile.open(file_name)
+            self.headline = self.store.headline
+            self.columnar = True
+            self.cache = None
+            self.__rows = None
+        else:
+            self.__rows = self.instrumentation.wrap("clean", self.__clean_properties(
+                vacancies=self.instrumentation.wrap("read", self.__reader(file_name=file_name))
+            ))
+        self.columns = [column for column in self.headline if column not in deferred]
+        self.vacancies_reader = self.instrumentation.wrap("vacancy", self.__make_vacancies())
+
+    def __make_vacancies(self) -> Generator[Vacancy, None, None]:
+        rows = self.get_store().rows() if self.columnar else self.__rows
+        for row in rows:
+            yield Vacancy(row, self.pool)
+
+    def select_rows(self, row_ids: Iterable[int]) -> Generator[Vacancy, None, None]:
+        store = self.get_store()
+        for row_id in row_ids:
+            yield Vacancy(store.row(row_id), self.pool)
+
+    def lookup(self, column: str, value: str or int) -> Iterable[int]:
+        store = self.get_store()
+        if column == "salary":
+            return store.get_salary_index().stab(value)
+        elif column == "key_skills":
+            return store.get_skill_index().lookup_all(value)
+        elif column == "text":
+            return self.get_text_index().search(value)
+        return store.get_index(column).lookup(value)
+
+    def get_text_index(self) -> TextIndex:
+        store = self.get_store()
+        if self.cache is None or "text" in store.indexes:
+            with self.instrumentation.stage("index"):
+                return store.get_text_index()
+
+        key = self.cache.fingerprint(self.file_name, self.__CACHE_NAMESPACE + ":text")
+        with self.instrumentation.stage("cache"):
+            index = self.cache.load(key)
+        if index is None or len(index) != len(store):
+            with self.instrumentation.stage("index"):
+                index = store.get_text_index()
+            with self.instrumentation.stage("cache"):
+                self.cache.save(key, index)
+        store.indexes["text"] = index
+        return index
+
+    def get_store(self) -> VacancyStore:
+        if self.store is not None:
+            if self.is_binary and len(self.store) == 0:
+                raise OutOfDataError
+            return self.store
+        if self.cache is None:
+            with self.instrumentation.stage("store"):
+                self.store = VacancyStore.from_rows(self.headline, self.__rows)
+            return self.store
+
+        key = self.cache.fingerprint(self.file_name, self.__get_namespace())
+        with self.instrumentation.stage("cache"):
+            self.store = self.cache.load(key)
+        if self.store is None:
+            with self.instrumentation.stage("store"):
+                self.store = VacancyStore.from_rows(self.headline, self.__rows)
+            with self.instrumentation.stage("cache"):
+                self.cache.save(key, self.store)
+        return self.store
+
+    def __get_namespace(self) -> str:
+        return "{0}:{1}".format(self.__CACHE_NAMESPACE, ",".join(self.columns))
+
+    def clean_deferred(self, vacancy: Vacancy) -> Vacancy:
+        if self.__rows is None:
+            return vacancy
+        for column in self.headline:
+            if column not in self.columns and isinstance(getattr(vacancy, column, None), str):
+                vacancy.__setattr__(column, self.__CLEANER.clean_prefix(
+                    vacancy.__getattribute__(column),
+                    column,
+                    Vacancy.DISPLAY_LENGTH
+                ).strip())
+        return vacancy
+
+    def __reader(self, file_name: str) -> csv.reader:
         reader = csv.reader(open(file_name), delimiter=',')
-        reader.__next__()
+        self.headline = [column.lstrip('\ufeff') for column in reader.__next__()]
         return reader
 
     @staticmethod
@@ -180,37 +302,89 @@ class DataSet:
                 return False
         return True
 
-    def __clean_properties(self, vacancies: csv.reader) -> Generator[Vacancy, None, None]:
+    def __clean_properties(self, vacancies: csv.reader) -> Generator[List[str], None, None]:
         i = 0
+        projected = [column in self.columns for column in self.headline]
+        validate = self.instrumentation.timed("validate", self.__validate)
         for vacancy in vacancies:
             i += 1
             clean_vacancy = []
-            if self.__validate(element=vacancy):
+            if validate(element=vacancy):
                 for merit_index in range(len(vacancy)):
-                    if merit_index == 2:
+                    column = self.headline[merit_index] if merit_index < len(self.headline) else None
+                    if column is not None and not projected[merit_index]:
+                        temp_property = vacancy[merit_index]
+                    elif merit_index == 2:
                         temp_property = vacancy[merit_index].split('\n')
                         for i in range(len(temp_property)):
-                            temp_property[i] = re.sub(self.__CLEANER, '', temp_property[i])
-                            temp_property[i] = re.sub(self.__SPACE_CLEANER, ' ', temp_property[i]).strip()
+                            temp_property[i] = self.__CLEANER.clean(temp_property[i], column).strip()
                     else:
-                        temp_property = re.sub(self.__CLEANER, '', vacancy[merit_index])
-                        temp_property = re.sub(self.__SPACE_CLEANER, ' ', temp_property).strip()
+                        temp_property = self.__CLEANER.clean(vacancy[merit_index], column).strip()
                     clean_vacancy.append(temp_property)
-                yield Vacancy(clean_vacancy)
+                yield clean_vacancy
         if i == 0:
             raise OutOfDataError
 
-    def get_sorted(self, sort_parameter: Callable, is_revers: bool) -> List[Vacancy] or Generator[Vacancy, None, None]:
+    def get_sort_key(self, sort_parameter: str) -> Callable or None:
         if sort_parameter == "":
-            return self.vacancies_reader
+            return None
         elif self.__sorter.__contains__(sort_parameter):
-            sort_key = self.__sorter[sort_parameter]
+            return self.__sorter[sort_parameter]
         else:
             raise SortParameterError
+
+    def get_sorted(self, sort_parameter: str, is_revers: bool) -> List[Vacancy] or Generator[Vacancy, None, None]:
+        sort_key = self.get_sort_key(sort_parameter)
+        if sort_key is None:
+            return self.vacancies_reader
         return sorted(list(self.vacancies_reader), key=sort_key, reverse=is_revers)
 
+    def get_window(self, sort_parameter: str, is_revers: bool, window: PrintWindow) -> Tuple[List[Vacancy], int]:
+        return window.select(self.vacancies_reader, self.get_sort_key(sort_parameter), is_revers)
+
 
 class InputConnect:
+    __DEFERRED_COLUMNS = ("description",)
+    __DEFERRABLE_COLUMNS = ("name", "description", "experience_id", "premium", "employer_name", "area_name")
+    __FILTER_CHECKER = {
+        "key_skills": lambda vacancy, value:
+        all(x in vacancy.key_skills for x in value),
+        "salary": lambda vacancy, value:
+        int(vacancy.salary.salary_from) <= value <= int(vacancy.salary.salary_to),
+        "published_at": lambda vacancy, value:
+        vacancy.published_at.year == value.year
+        and vacancy.published_at.month == value.month
+        and vacancy.published_at.day == value.day,
+        "experience_id": lambda vacancy, value:
+        vacancy.experience_id == value,
+        "premium": lambda vacancy, value:
+        vacancy.premium == value,
+        "salary_currency": lambda vacancy, value:
+        vacancy.salary.salary_currency == value,
+        "name": lambda vacancy, value:
+        vacancy.name == value,
+        "area_name": lambda vacancy, value:
+        vacancy.area_name == value,
+        "employer_name": lambda vacancy, value:
+        vacancy.employer_name == value,
+        "description": lambda vacancy, value:
+        vacancy.description == value,
+        "text": lambda vacancy, value:
+        TextIndex.matches(vacancy.name + " " + vacancy.description, value)
+    }
+    __INDEXED_FILTERS = (
+        "key_skills",
+        "salary",
+        "experience_id",
+        "premium",
+        "salary_currency",
+        "name",
+        "area_name",
+        "employer_name",
+        "description",
+        "text"
+    )
+
     def __init__(
             self,
             filename,
@@ -218,18 +392,44 @@ class InputConnect:
             sort_parameter,
             is_revers,
             print_range,
-            print_columns
-
+            print_columns,
+            columnar: bool = False,
+            cache: ParseCache = None,
+            store: VacancyStore = None,
+            instrumentation: Instrumentation = None
     ):
-        self.vacancies = DataSet(file_name=filename.strip())
         self.filter_parameter = self.get_filter(filter_parameter.strip())
         self.sort_parameter = sort_parameter.strip()
+        self.print_columns = print_columns.strip().split(", ")
+        self.vacancies = DataSet(
+            file_name=filename.strip(),
+            columnar=columnar,
+            cache=cache,
+            store=store,
+            instrumentation=instrumentation,
+            deferred=self.get_deferred()
+        )
         self.is_revers = self.get_sort_way(is_revers.strip())
         self.print_range = print_range.strip().split(" ")
-        self.print_columns = print_columns.strip().split(", ")
         self.filter_vacancies()
 
     def __str__(self):
+        my_table, start, end = self.make_table()
+        with self.vacancies.instrumentation.stage("render"):
+            return my_table.get_string(fields=self.print_columns, start=start, end=end)
+
+    def to_json(self) -> str:
+        my_table, start, end = self.make_table()
+        with self.vacancies.instrumentation.stage("render"):
+            return json.dumps([
+                {
+                    field: value.__str__()
+                    for field, value in zip(my_table.field_names, row) if field in self.print_columns
+                }
+                for row in my_table.rows[start:end]
+            ], ensure_ascii=False)
+
+    def make_table(self) -> Tuple[PrettyTable, int, int]:
         my_table = PrettyTable()
         row_count = 0
         my_table.field_names = [
@@ -244,9 +444,23 @@ class InputConnect:
             "Название региона",
             "Дата публикации вакансии"
         ]
-        for row in self.vacancies.get_sorted(self.sort_parameter, self.is_revers):
-            row_count += 1
-            my_table.add_row([row_count.__str__()] + row.make_table_row())
+        window = PrintWindow(self.print_range)
+        instrumentation = self.vacancies.instrumentation
+        clean_deferred = instrumentation.timed("clean_deferred", self.vacancies.clean_deferred)
+        if window.is_valid:
+            with instrumentation.stage("sort"):
+                rows, row_count = self.vacancies.get_window(self.sort_parameter, self.is_revers, window)
+            with instrumentation.stage("render"):
+                for number, row in enumerate(rows, window.start):
+                    my_table.add_row([number.__str__()] + clean_deferred(row).make_table_row())
+        else:
+            with instrumentation.stage("sort"):
+                rows = self.vacancies.get_sorted(self.sort_parameter, self.is_revers)
+            with instrumentation.stage("render"):
+                for row in rows:
+                    row_count += 1
+                    my_table.add_row([row_count.__str__()] + clean_deferred(row).make_table_row())
+        instrumentation.count("render", rows_out=row_count)
 
         if row_count == 0:
             raise AssertionError
@@ -257,19 +471,41 @@ class InputConnect:
             self.print_columns = my_table.field_names
         else:
             self.print_columns.insert(0, "№")
+        if window.is_valid:
+            return my_table, 0, my_table.rowcount
         if self.print_range[0] == '':
             self.print_range = [1, row_count + 1]
         elif len(self.print_range) < 2:
             self.print_range.append(str(row_count + 1))
 
-        return my_table.get_string(
-            fields=self.print_columns,
-            start=int(self.print_range[0]) - 1,
-            end=int(self.print_range[1]) - 1
-        )
+        return my_table, int(self.print_range[0]) - 1, int(self.print_range[1]) - 1
+
+    def get_deferred(self) -> List[str]:
+        needed = [condition[0] for condition in self.get_expression().conditions()] if self.filter_parameter else []
+        if self.sort_parameter in Translator.translation_filter:
+            needed.append(Translator.translation_filter[self.sort_parameter])
+        if "text" in needed:
+            needed += TextIndex.COLUMNS
+        deferred = list(self.__DEFERRED_COLUMNS)
+        if self.print_columns[0] != '':
+            printed = [Translator.translation_filter.get(column) for column in self.print_columns]
+            deferred += [column for column in self.__DEFERRABLE_COLUMNS if column not in printed + deferred]
+        return [column for column in deferred if column not in needed]
+
+    def get_expression(self) -> FilterExpression:
+        if isinstance(self.filter_parameter, FilterExpression):
+            return self.filter_parameter
+        return FilterExpression.from_condition(self.filter_parameter)
 
     @staticmethod
-    def get_filter(string: str) -> tuple or None:
+    def get_filter(string: str) -> tuple or FilterExpression or None:
+        if string == '':
+            return None
+        expression = FilterExpression.parse(string, Translator.translation_filter, InputConnect.get_condition)
+        return expression.condition if expression.kind == FilterExpression.CONDITION else expression
+
+    @staticmethod
+    def get_condition(string: str) -> tuple:
         filter_name_to_parse = {
             "key_skills": lambda to_parse:
             to_parse.split(", "),
@@ -285,8 +521,6 @@ class InputConnect:
             Translator.inverse_dict(Translator.translation_currency)[to_parse]
         }
 
-        if string == '':
-            return None
         if not string.__contains__(':'):
             raise IOError
 
@@ -318,61 +552,70 @@ class InputConnect:
         table.align = 'l'
 
     def filter_vacancies(self):
-        filter_checker = {
-            "key_skills": lambda vacancy:
-            all(x in vacancy.key_skills for x in self.filter_parameter[1]),
-            "salary": lambda vacancy:
-            int(vacancy.salary.salary_from) <= self.filter_parameter[1] <= int(vacancy.salary.salary_to),
-            "published_at": lambda vacancy:
-            all([
-                vacancy.published_at.year == self.filter_parameter[1].year,
-                vacancy.published_at.month == self.filter_parameter[1].month,
-                vacancy.published_at.day == self.filter_parameter[1].day
-            ]),
-            "experience_id": lambda vacancy:
-            vacancy.experience_id == self.filter_parameter[1],
-            "premium": lambda vacancy:
-            vacancy.premium == self.filter_parameter[1],
-            "salary_currency": lambda vacancy:
-            vacancy.salary.salary_currency == self.filter_parameter[1],
-            "name": lambda vacancy:
-            vacancy.name == self.filter_parameter[1],
-            "area_name": lambda vacancy:
-            vacancy.area_name == self.filter_parameter[1],
-            "employer_name": lambda vacancy:
-            vacancy.employer_name == self.filter_parameter[1],
-            "description": lambda vacancy:
-            vacancy.description == self.filter_parameter[1]
-        }
-
-        if self.filter_parameter:
+        if not self.filter_parameter:
+            return
+        if self.vacancies.columnar:
+            self.vacancies.vacancies_reader = self.__select(self.get_expression(), self.vacancies.vacancies_reader)
+        else:
             self.vacancies.vacancies_reader = filter(
-                filter_checker[self.filter_parameter[0]],
+                self.vacancies.instrumentation.timed("filter", self.get_expression().compile(self.__FILTER_CHECKER)),
                 self.vacancies.vacancies_reader
             )
 
-
-try:
-    input_connect = InputConnect(
-        input("Введите название файла: "),
-        input("Введите параметр фильтрации: "),
-        input("Введите параметр сортировки: "),
-        input("Обратный порядок сортировки (Да / Нет): "),
-        input("Введите диапазон вывода: "),
-        input("Введите требуемые столбцы: ")
-    )
-    print(input_connect)
-except StopIteration:
-    print("Пустой файл")
-except IOError:
-    print("Формат ввода некорректен")
-except KeyError:
-    print("Параметр поиска некорректен")
-except SortParameterError:
-    print("Параметр сортировки некорректен")
-except SortWayError:
-    print("Порядок сортировки задан некорректно")
-except AssertionError:
-    print("Ничего не найдено")
-except OutOfDataError:
-    print("Нет данных")
+    def __select(
+            self,
+            expression: FilterExpression,
+            vacancies: Iterable[Vacancy]
+    ) -> Generator[Vacancy, None, None]:
+        instrumentation = self.vacancies.instrumentation
+        size = len(self.vacancies.get_store())
+        with instrumentation.stage("index"):
+            row_ids, residual = expression.plan(
+                lambda condition:
+                    self.vacancies.lookup(*condition) if condition[0] in self.__INDEXED_FILTERS else None,
+                size
+            )
+        if row_ids is not None:
+            instrumentation.count("index", rows_in=size, rows_out=len(row_ids))
+            queries = [value for column, value in expression.conditions() if column == "text"]
+            if queries and self.sort_parameter == "":
+                with instrumentation.stage("index"):
+                    row_ids = [row_id for row_id, _ in self.vacancies.get_text_index().rank(" ".join(queries), row_ids)]
+            vacancies = instrumentation.wrap("vacancy", self.vacancies.select_rows(row_ids))
+        if residual is not None:
+            vacancies = filter(instrumentation.timed("filter", residual.compile(self.__FILTER_CHECKER)), vacancies)
+        yield from vacancies
+
+
+if __name__ == "__main__":
+    instrumentation = Instrumentation.from_environment()
+    try:
+        input_connect = InputConnect(
+            input("Введите название файла: "),
+            input("Введите параметр фильтрации: "),
+            input("Введите параметр сортировки: "),
+            input("Обратный порядок сортировки (Да / Нет): "),
+            input("Введите диапазон вывода: "),
+            input("Введите требуемые столбцы: "),
+            columnar=True,
+            cache=ParseCache(),
+            instrumentation=instrumentation
+        )
+        print(input_connect)
+    except StopIteration:
+        print("Пустой файл")
+    except IOError:
+        print("Формат ввода некорректен")
+    except KeyError:
+        print("Параметр поиска некорректен")
+    except SortParameterError:
+        print("Параметр сортировки некорректен")
+    except SortWayError:
+        print("Порядок сортировки задан некорректно")
+    except AssertionError:
+        print("Ничего не найдено")
+    except OutOfDataError:
+        print("Нет данных")
+    except VacancyFileError:
+        print("Формат файла некорректен")
+    instrumentation.emit()
@@ -0,0 +1,40 @@
+import csv
+import os
+import random
+import tempfile
+import unittest
+from chunked_reader import ChunkedReader
+
+
+def make_field(generator: random.Random) -> str:
+    parts = ("a", "Москва", " ", ",", "\"", "\"\"", "\n", "\r\n", "<b>", "1")
+    return "".join(generator.choice(parts) for _ in range(generator.randint(0, 8)))
+
+
+class ChunkedReaderTest(unittest.TestCase):
+    def test_ranges_concatenate_to_csv_reader_rows(self):
+        generator = random.Random(13)
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "vacancies.csv")
+            for _ in range(20):
+                with open(file_name, "w", newline="", encoding="utf-8") as file:
+                    writer = csv.writer(file)
+                    writer.writerow(["name", "description\nс переносом", "area_name"])
+                    for _ in range(generator.randint(0, 80)):
+                        writer.writerow([make_field(generator) for _ in range(3)])
+                with open(file_name, newline="", encoding="utf-8") as file:
+                    expected = list(csv.reader(file))[1:]
+
+                for chunks in (1, 2, 3, 7, 50, 500):
+                    ranges = ChunkedReader.split(file_name, chunks)
+                    self.assertLessEqual(len(ranges), chunks)
+                    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+                        self.assertEqual(end, start)
+                    rows = []
+                    for start, end in ranges:
+                        rows += list(csv.reader(ChunkedReader.read_lines(file_name, start, end)))
+                    self.assertEqual(rows, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import random
+import unittest
+from cleaner import Cleaner
+
+PARTS = ("a", "ё", "x" * 20, " ", "  ", "\t", "\n", "\r", "\xa0", "<", ">", "<p>", "</b>", "<br\n>", "<a href='x'>")
+
+
+class CleanerTest(unittest.TestCase):
+    def test_clean_prefix_is_prefix_of_clean(self):
+        cleaner = Cleaner()
+        generator = random.Random(3)
+        for _ in range(5000):
+            value = "".join(generator.choice(PARTS) for _ in range(generator.randint(0, 300)))
+            length = generator.choice((1, 5, 20, 100))
+            column = generator.choice(("description", "salary_from", "premium", None))
+            prefix = cleaner.clean_prefix(value, column, length)
+            full = cleaner.clean(value, column)
+            self.assertTrue(full.startswith(prefix), (value, column, length))
+            self.assertTrue(prefix == full or len(prefix.lstrip()) > length, (value, column, length))
+            self.assertEqual(prefix.strip()[:length], full.strip()[:length])
+            self.assertEqual(len(prefix.strip()) > length, len(full.strip()) > length)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import csv
+import hashlib
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from benchmark_tools import load_script
+from deduplicator import BloomFilter, Deduplicator, SpillingSet
+from vacancy_file import VacancyFile
+from year_splitter import YearSplitter
+
+HEADLINE = [
+    "name", "description", "key_skills", "experience_id", "premium", "employer_name",
+    "salary_from", "salary_to", "salary_gross", "salary_currency", "area_name", "published_at"
+]
+
+
+def get_digest(value: int) -> bytes:
+    return hashlib.blake2b(str(value).encode("utf-8"), digest_size=Deduplicator.DIGEST_SIZE).digest()
+
+
+def make_row(generator: random.Random, year: int) -> list:
+    salary_from = generator.choice((10000, 20000, 30000))
+    return [
+        generator.choice(("Программист", "Аналитик", "Тестировщик")),
+        "Описание",
+        "Python",
+        "noExperience",
+        "False",
+        generator.choice(("Компания 1", "Компания 2")),
+        str(salary_from),
+        str(salary_from + generator.choice((0, 5000))),
+        "True",
+        generator.choice(("RUR", "USD")),
+        generator.choice(("Москва", "Казань")),
+        "{0}-0{1}-1{2}T12:00:00+0300".format(year, generator.randint(1, 9), generator.randint(0, 9))
+    ]
+
+
+class BloomFilterTest(unittest.TestCase):
+    def test_has_no_false_negatives(self):
+        bloom = BloomFilter(2000, 0.01)
+        digests = [get_digest(value) for value in range(2000)]
+        for digest in digests:
+            bloom.add(digest)
+        self.assertTrue(all(digest in bloom for digest in digests))
+
+    def test_false_positive_rate_is_close_to_target(self):
+        bloom = BloomFilter(5000, 0.01)
+        for value in range(5000):
+            bloom.add(get_digest(value))
+        false_positives = sum(get_digest(value) in bloom for value in range(5000, 25000))
+        self.assertLess(false_positives / 20000, 0.02)
+
+    def test_false_positive_rate_for_each_target(self):
+        for capacity, error_rate in ((1000, 0.05), (10000, 0.01), (10000, 0.001)):
+            bloom = BloomFilter(capacity, error_rate)
+            for value in range(capacity):
+                bloom.add(get_digest(value))
+            self.assertGreater(bloom.count, capacity * (1 - 2 * error_rate))
+            trials = max(20000, int(100 / error_rate))
+            false_positives = sum(get_digest(value) in bloom for value in range(capacity, capacity + trials))
+            self.assertLess(false_positives / trials, 2 * error_rate, error_rate)
+            self.assertGreater(false_positives / trials, error_rate / 4, error_rate)
+
+
+class SpillingSetTest(unittest.TestCase):
+    def test_matches_builtin_set_across_spills(self):
+        generator = random.Random(23)
+        directory = tempfile.mkdtemp()
+        try:
+            spilling = SpillingSet(max_size=50, capacity=2000, directory=directory)
+            expected = set()
+            for _ in range(3000):
+                digest = get_digest(generator.randint(0, 1500))
+                self.assertEqual(spilling.add(digest), digest in expected)
+                expected.add(digest)
+            self.assertEqual(spilling.count, len(expected))
+            for value in range(2000):
+                self.assertEqual(get_digest(value) in spilling, get_digest(value) in expected)
+            spilling.close()
+        finally:
+            shutil.rmtree(directory)
+
+
+class DeduplicatorTest(unittest.TestCase):
+    def test_exact_mode_keeps_first_occurrence(self):
+        generator = random.Random(230)
+        rows = [make_row(generator, generator.randint(2010, 2012)) for _ in range(2000)]
+        deduplicator = Deduplicator(Deduplicator.EXACT, max_memory_keys=64)
+        kept = list(deduplicator.filter(rows, HEADLINE))
+        deduplicator.close()
+
+        expected = {}
+        for row in rows:
+            expected.setdefault(self.__get_key(row), row)
+        self.assertEqual(kept, list(expected.values()))
+        self.assertEqual(deduplicator.duplicates, len(rows) - len(kept))
+
+    def test_bloom_mode_drops_every_duplicate(self):
+        generator = random.Random(231)
+        rows = [make_row(generator, 2020) for _ in range(2000)]
+        deduplicator = Deduplicator(Deduplicator.BLOOM, capacity=1000, error_rate=0.001)
+        kept = list(deduplicator.filter(rows, HEADLINE))
+        keys = [self.__get_key(row) for row in kept]
+        self.assertEqual(len(keys), len(set(keys)))
+        self.assertLessEqual(len(set(self.__get_key(row) for row in rows)) - len(keys), 1)
+
+    def test_every_mode_keeps_first_copy_by_file_position(self):
+        statistics = load_script("task5_3", "task5.3.py")
+        generator = random.Random(232)
+        clean_rows = [make_row(generator, generator.randint(2015, 2019)) for _ in range(1000)]
+        rows = [list(row) for row in clean_rows]
+        for row in rows:
+            if generator.random() < 0.5:
+                row[HEADLINE.index("employer_name")] = "<b>{0}</b> ".format(row[HEADLINE.index("employer_name")])
+        directory = tempfile.mkdtemp()
+        try:
+            file_name = os.path.join(directory, "vacancies.csv")
+            with open(file_name, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(HEADLINE)
+                writer.writerows(rows)
+            YearSplitter.split(file_name, os.path.join(directory, "years"))
+            VacancyFile.write(statistics.DataSet(file_name).get_store(), os.path.join(directory, "vacancies.vacb"))
+
+            first = {}
+            for row in clean_rows:
+                first.setdefault(self.__get_key(row), row)
+            expected = {}
+            for row in first.values():
+                year = int(row[-1][:4])
+                expected[year] = expected.get(year, 0) + 1
+
+            for name, columnar in (("vacancies.csv", False), ("vacancies.csv", True), ("vacancies.vacb", False), ("years", False)):
+                deduplicator = Deduplicator(Deduplicator.EXACT)
+                input_connect = statistics.InputConnect(
+                    os.path.join(directory, name),
+                    "Программист",
+                    columnar=columnar,
+                    deduplicator=deduplicator
+                )
+                self.assertEqual(list(input_connect.all_vacancies_count.items()), list(expected.items()), name)
+                self.assertEqual(deduplicator.duplicates, len(rows) - len(first), name)
+        finally:
+            shutil.rmtree(directory)
+
+    @staticmethod
+    def __get_key(row: list) -> tuple:
+        return tuple(row[HEADLINE.index(column)] for column in Deduplicator.KEY)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import random
+import unittest
+from filter_expression import FilterExpression
+
+FIELDS = {"Название": "name", "Компания": "employer_name", "Оклад": "salary"}
+NAMES = ("a", "b", "c")
+INDEXED = ("name",)
+
+
+def parse_condition(string: str) -> tuple:
+    if ':' not in string:
+        raise IOError
+    field, value = [part.strip() for part in string.split(':', 1)]
+    column = FIELDS[field]
+    return column, int(value) if column == "salary" else value
+
+
+def parse(string: str) -> FilterExpression:
+    return FilterExpression.parse(string, FIELDS, parse_condition)
+
+
+def check(row: dict, value: str, column: str) -> bool:
+    return row[column] == value
+
+
+CHECKERS = {
+    "name": lambda row, value: check(row, value, "name"),
+    "employer_name": lambda row, value: check(row, value, "employer_name")
+}
+
+
+def make_expression(generator: random.Random) -> tuple:
+    terms = []
+    for _ in range(generator.randint(1, 3)):
+        factors = []
+        for _ in range(generator.randint(1, 3)):
+            column, field = generator.choice((("name", "Название"), ("employer_name", "Компания")))
+            value = generator.choice(NAMES)
+            is_negated = generator.random() < 0.3
+            factors.append((column, value, is_negated, "{0}{1}: {2}".format("!" if is_negated else "", field, value)))
+        terms.append(factors)
+    string = " | ".join(" & ".join(factor[3] for factor in factors) for factors in terms)
+    return string, terms
+
+
+def evaluate(terms: list, row: dict) -> bool:
+    return any(
+        all(check(row, value, column) != is_negated for column, value, is_negated, _ in factors)
+        for factors in terms
+    )
+
+
+class FilterExpressionTest(unittest.TestCase):
+    def test_and_binds_tighter_than_or(self):
+        expression = parse("Название: a & Компания: b | !Компания: c")
+        self.assertEqual(expression.kind, FilterExpression.OR)
+        self.assertEqual([operand.kind for operand in expression.operands], [FilterExpression.AND, FilterExpression.NOT])
+        self.assertEqual(expression.operands[0].conditions(), [("name", "a"), ("employer_name", "b")])
+        self.assertEqual(expression.operands[1].conditions(), [("employer_name", "c")])
+
+    def test_separators_inside_values_are_kept(self):
+        expression = parse("Название: a & b | c & Компания: d")
+        self.assertEqual(expression.kind, FilterExpression.AND)
+        self.assertEqual(expression.conditions(), [("name", "a & b | c"), ("employer_name", "d")])
+        expression = parse("Название: a & Город: Москва")
+        self.assertEqual(expression.kind, FilterExpression.CONDITION)
+        self.assertEqual(expression.condition, ("name", "a & Город: Москва"))
+
+    def test_parse_errors(self):
+        for string, error in (
+                ("Название a", IOError),
+                ("Город: Москва", KeyError),
+                ("Оклад: много", ValueError),
+                ("Название: a | !Оклад: вчера", ValueError)
+        ):
+            with self.assertRaises(error):
+                parse(string)
+
+    def test_compile_and_plan_match_reference(self):
+        generator = random.Random(17)
+        rows = [{"name": name, "employer_name": employer} for name in NAMES for employer in NAMES] * 2
+        for _ in range(300):
+            string, terms = make_expression(generator)
+            expression = parse(string)
+            expected = [row_id for row_id, row in enumerate(rows) if evaluate(terms, row)]
+
+            matches = expression.compile(CHECKERS)
+            self.assertEqual([row_id for row_id, row in enumerate(rows) if matches(row)], expected, string)
+
+            row_ids, residual = expression.plan(
+                lambda condition: [row_id for row_id, row in enumerate(rows) if check(row, condition[1], condition[0])]
+                if condition[0] in INDEXED else None,
+                len(rows)
+            )
+            candidates = range(len(rows)) if row_ids is None else row_ids
+            if residual is not None:
+                matches = residual.compile(CHECKERS)
+                candidates = [row_id for row_id in candidates if matches(rows[row_id])]
+            self.assertEqual(list(candidates), expected, string)
+            if all(condition[0] in INDEXED for condition in expression.conditions()):
+                self.assertIsNone(residual)
+
+    def test_plan_splits_indexed_and_residual_operands(self):
+        lookup = {("name", "a"): [0, 2, 4]}.get
+        row_ids, residual = parse("Название: a & Компания: b").plan(lookup, 6)
+        self.assertEqual(row_ids, [0, 2, 4])
+        self.assertEqual(residual.conditions(), [("employer_name", "b")])
+
+        row_ids, residual = parse("!Название: a").plan(lookup, 6)
+        self.assertEqual((row_ids, residual), ([1, 3, 5], None))
+
+        expression = parse("Название: a | Компания: b")
+        self.assertEqual(expression.plan(lookup, 6), (None, expression))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import collections
+import csv
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+from heavy_hitters import SpaceSaving
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_stream(generator: random.Random, size: int, distinct: int) -> list:
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    return generator.choices(range(distinct), weights, k=size)
+
+
+class SpaceSavingTest(unittest.TestCase):
+    def test_counts_bound_true_frequencies(self):
+        generator = random.Random(25)
+        for capacity in (1, 5, 20, 100):
+            stream = make_stream(generator, 5000, 300)
+            exact = collections.Counter(stream)
+            counters = SpaceSaving(capacity)
+            for item in stream:
+                counters.add(item)
+            self.assertEqual(counters.total, len(stream))
+            self.assertEqual(sum(counters.counts.values()), len(stream))
+            self.assertLessEqual(len(counters), capacity)
+            for item, count in counters.counts.items():
+                self.assertLessEqual(count - counters.errors[item], exact[item])
+                self.assertLessEqual(exact[item], count)
+            for item, count in exact.items():
+                if count > len(stream) / capacity:
+                    self.assertIn(item, counters)
+
+    def test_heavy_hitters_are_guaranteed(self):
+        generator = random.Random(250)
+        for capacity in (20, 200):
+            stream = make_stream(generator, 20000, 2000)
+            exact = collections.Counter(stream)
+            counters = SpaceSaving(capacity)
+            for item in stream:
+                counters.add(item)
+            heavy_hitters = counters.heavy_hitters(0.01)
+            for item, count in heavy_hitters.items():
+                self.assertEqual(count, counters.guaranteed(item))
+                self.assertLessEqual(count, exact[item])
+                self.assertGreater(exact[item] / len(stream), 0.01)
+            for item, count in exact.items():
+                if count / len(stream) > 0.01 + 1 / capacity:
+                    self.assertIn(item, heavy_hitters)
+
+    def test_identical_to_exact_counts_within_capacity(self):
+        generator = random.Random(251)
+        for _ in range(50):
+            distinct = generator.randint(1, 60)
+            stream = make_stream(generator, generator.randint(1, 3000), distinct)
+            exact = collections.Counter(stream)
+            counters = SpaceSaving(distinct)
+            for item in stream:
+                counters.add(item)
+            self.assertEqual(counters.counts, dict(exact))
+            self.assertEqual(
+                counters.heavy_hitters(0.01),
+                {item: count for item, count in exact.items() if count / len(stream) > 0.01}
+            )
+
+
+class PramHeavyHittersTest(unittest.TestCase):
+    def test_output_matches_exact_mode(self):
+        generator = random.Random(252)
+        headline = ["name", "salary_currency", "area_name"]
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "vacancies.csv")
+            with open(file_name, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(headline)
+                for name in make_stream(generator, 3000, 40):
+                    writer.writerow([
+                        "Профессия {0}".format(name),
+                        generator.choice(("RUR", "RUR", "USD")),
+                        generator.choice(("Москва", "Казань", "Пермь"))
+                    ])
+            self.assertEqual(self.__run(file_name, ""), self.__run(file_name, "40"))
+
+    @staticmethod
+    def __run(file_name: str, capacity: str) -> str:
+        environment = dict(os.environ, **{SpaceSaving.VARIABLE: capacity})
+        return subprocess.run(
+            [sys.executable, os.path.join(ROOT, "Pram.py")],
+            input=file_name + "\n",
+            capture_output=True,
+            text=True,
+            cwd=ROOT,
+            env=environment,
+            check=True
+        ).stdout
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import random
+import unittest
+from array import array
+from vacancy_index import IntervalIndex
+
+
+class IntervalIndexTest(unittest.TestCase):
+    def test_stab_matches_brute_force(self):
+        generator = random.Random(8)
+        for _ in range(200):
+            size = generator.randint(0, 60)
+            bound = generator.choice((5, 50, 10 ** 6))
+            lows = array('q', [generator.randint(0, bound) for _ in range(size)])
+            highs = array('q', [low + generator.randint(-bound // 5, bound) for low in lows])
+            index = IntervalIndex(lows, highs)
+            points = [generator.randint(-1, bound * 2) for _ in range(20)] + list(lows) + list(highs)
+            for point in points:
+                expected = [row_id for row_id in range(size) if lows[row_id] <= point <= highs[row_id]]
+                self.assertEqual(list(index.stab(point)), expected)
+
+    def test_empty_and_inverted_intervals(self):
+        self.assertEqual(list(IntervalIndex(array('q'), array('q')).stab(0)), [])
+        index = IntervalIndex(array('q', [10, 5, 7]), array('q', [1, 5, 9]))
+        self.assertEqual(list(index.stab(5)), [1])
+        self.assertEqual(list(index.stab(8)), [2])
+        self.assertEqual(list(index.stab(10)), [])
+
+    def test_only_inverted_intervals(self):
+        index = IntervalIndex(array('q', [3, 9, 1]), array('q', [2, 4, 0]))
+        for point in range(-1, 11):
+            self.assertEqual(list(index.stab(point)), [])
+
+    def test_point_duplicate_and_extreme_intervals(self):
+        lows = array('q', [5, 5, 5, -2 ** 62, 0, 5])
+        highs = array('q', [5, 5, 6, 2 ** 62, 0, 4])
+        index = IntervalIndex(lows, highs)
+        self.assertEqual(list(index.stab(5)), [0, 1, 2, 3])
+        self.assertEqual(list(index.stab(6)), [2, 3])
+        self.assertEqual(list(index.stab(0)), [3, 4])
+        self.assertEqual(list(index.stab(-2 ** 62)), [3])
+        self.assertEqual(list(index.stab(2 ** 62 + 1)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
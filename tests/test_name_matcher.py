@@ -0,0 +1,43 @@
+import random
+import unittest
+from name_matcher import NameMatcher
+
+
+class NameMatcherTest(unittest.TestCase):
+    def test_match_equals_substring_search(self):
+        generator = random.Random(21)
+        for _ in range(200):
+            alphabet = generator.choice(("ab", "abc", "абвг "))
+            patterns = [
+                "".join(generator.choice(alphabet) for _ in range(generator.randint(0, 4)))
+                for _ in range(generator.randint(1, 12))
+            ]
+            matcher = NameMatcher(patterns)
+            for _ in range(30):
+                text = "".join(generator.choice(alphabet) for _ in range(generator.randint(0, 20)))
+                expected = tuple(index for index, pattern in enumerate(patterns) if pattern in text)
+                self.assertEqual(matcher.match(text), expected)
+                self.assertEqual(matcher.match(text), expected)
+
+    def test_overlapping_and_repeated_patterns(self):
+        matcher = NameMatcher(["he", "she", "his", "hers", "he", ""])
+        self.assertEqual(matcher.match("ushers"), (0, 1, 3, 4, 5))
+        self.assertEqual(matcher.match("hi"), (5,))
+        self.assertEqual(matcher.match(""), (5,))
+
+    def test_nested_profession_names(self):
+        patterns = ["программист", "программист python", "python", "java", "javascript", "script"]
+        matcher = NameMatcher(patterns)
+        self.assertEqual(matcher.match("старший программист python"), (0, 1, 2))
+        self.assertEqual(matcher.match("javascript-разработчик"), (3, 4, 5))
+        self.assertEqual(matcher.match("программист pytho"), (0,))
+        self.assertEqual(matcher.match("программис"), ())
+
+    def test_bounded_cache(self):
+        matcher = NameMatcher(["ab", "b"], cache_size=2)
+        for text in ("ab", "b", "a", "ab", "cab", "b"):
+            self.assertEqual(matcher.match(text), tuple(index for index, pattern in enumerate(["ab", "b"]) if pattern in text))
+
+
+if __name__ == "__main__":
+    unittest.main()
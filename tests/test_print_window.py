@@ -0,0 +1,48 @@
+import random
+import unittest
+from print_window import PrintWindow
+
+
+class PrintWindowTest(unittest.TestCase):
+    def test_invalid_ranges(self):
+        for print_range in (["0"], ["0", "5"], ["3", "0"], ["-1"], ["a"], ["1", "b"]):
+            self.assertFalse(PrintWindow(print_range).is_valid, print_range)
+        window = PrintWindow([""])
+        self.assertTrue(window.is_valid)
+        self.assertFalse(window.is_bounded)
+
+    def test_select_matches_sorted_slice(self):
+        generator = random.Random(10)
+        for _ in range(300):
+            size = generator.randint(0, 30)
+            rows = [(generator.randint(0, 5), row_id) for row_id in range(size)]
+            key = generator.choice((None, lambda row: row[0]))
+            reverse = generator.random() < 0.5
+            start = generator.randint(1, size + 3)
+            bounds = [str(start)] if generator.random() < 0.3 else [str(start), str(generator.randint(start, size + 5))]
+            window = PrintWindow(bounds)
+
+            selected, count = window.select(iter(rows), key, reverse)
+            ordered = sorted(rows, key=key, reverse=reverse) if key else rows
+            end = int(bounds[1]) if len(bounds) > 1 else len(rows) + 1
+            self.assertEqual(selected, ordered[start - 1:end - 1], bounds)
+            if window.is_bounded:
+                self.assertEqual(count, min(len(rows), max(end - 1, 1)))
+            else:
+                self.assertEqual(count, len(rows))
+
+    def test_ties_keep_input_order(self):
+        rows = [(1, "a"), (0, "b"), (1, "c"), (0, "d"), (1, "e")]
+        key = lambda row: row[0]
+        self.assertEqual(PrintWindow(["1", "4"]).select(rows, key)[0], [(0, "b"), (0, "d"), (1, "a")])
+        self.assertEqual(PrintWindow(["2", "4"]).select(rows, key, True)[0], [(1, "c"), (1, "e")])
+
+    def test_range_beyond_size(self):
+        rows = list(range(3))
+        self.assertEqual(PrintWindow(["5", "10"]).select(rows), ([], 3))
+        self.assertEqual(PrintWindow(["4"]).select(rows), ([], 3))
+        self.assertEqual(PrintWindow(["2", "2"]).select(rows), ([], 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
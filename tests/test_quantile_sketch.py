@@ -0,0 +1,100 @@
+import math
+import random
+import unittest
+from bisect import bisect_left, bisect_right
+from quantile_sketch import ExactQuantiles, KllSketch, QuantileSketch
+
+SHARES = [share / 100 for share in range(1, 100)]
+
+
+def get_rank_error(values: list, value: float, share: float) -> float:
+    low, high = bisect_left(values, value), bisect_right(values, value)
+    target = share * len(values)
+    if low <= target <= high:
+        return 0.0
+    return min(abs(low - target), abs(high - target)) / len(values)
+
+
+class KllSketchTest(unittest.TestCase):
+    def test_rank_error_on_a_million_values(self):
+        generator = random.Random(24)
+        values = [generator.lognormvariate(11, 0.6) for _ in range(1_000_000)]
+        sketch = KllSketch()
+        for value in values:
+            sketch.add(value)
+        values.sort()
+        self.assertLess(max(get_rank_error(values, sketch.quantile(share), share) for share in SHARES), 0.01)
+        self.assertLess(sum(len(compactor) for compactor in sketch.compactors), 1000)
+
+    def test_merged_sketch_matches_exact_quantiles(self):
+        generator = random.Random(240)
+        values = [generator.randint(10000, 500000) for _ in range(200_000)]
+        sketches = [KllSketch() for _ in range(7)]
+        for value in values:
+            generator.choice(sketches).add(value)
+        merged = KllSketch()
+        for sketch in sketches:
+            merged.merge(QuantileSketch.from_dict(sketch.to_dict()))
+        values.sort()
+        self.assertEqual(len(merged), len(values))
+        self.assertLess(max(get_rank_error(values, merged.quantile(share), share) for share in SHARES), 0.01)
+
+    def test_merge_of_uneven_and_disjoint_sketches(self):
+        generator = random.Random(243)
+        large = [generator.uniform(0, 1000) for _ in range(300_000)]
+        small = [generator.uniform(2000, 3000) for _ in range(3000)]
+        for first, second in ((large, small), (small, large), (large, [])):
+            left, right = KllSketch(), KllSketch()
+            for value in first:
+                left.add(value)
+            for value in second:
+                right.add(value)
+            merged = left.merge(right)
+            values = sorted(first + second)
+            self.assertEqual(len(merged), len(values))
+            weight = sum(len(compactor) * 2 ** height for height, compactor in enumerate(merged.compactors))
+            self.assertEqual(weight, len(values))
+            self.assertLess(max(get_rank_error(values, merged.quantile(share), share) for share in SHARES), 0.01)
+            self.assertLess(sum(len(compactor) for compactor in merged.compactors), 1000)
+
+    def test_repeated_merges_stay_bounded(self):
+        generator = random.Random(244)
+        merged, values = KllSketch(), []
+        for _ in range(200):
+            sketch = KllSketch()
+            for _ in range(generator.randint(0, 2000)):
+                value = generator.gauss(50000, 15000)
+                sketch.add(value)
+                values.append(value)
+            merged.merge(sketch)
+        values.sort()
+        self.assertEqual(len(merged), len(values))
+        self.assertLess(max(get_rank_error(values, merged.quantile(share), share) for share in SHARES), 0.01)
+        self.assertLess(sum(len(compactor) for compactor in merged.compactors), 1000)
+
+    def test_small_inputs_are_exact(self):
+        generator = random.Random(241)
+        for size in range(1, 150):
+            values = [generator.random() for _ in range(size)]
+            sketch, exact = KllSketch(), ExactQuantiles()
+            for value in values:
+                sketch.add(value)
+                exact.add(value)
+            for share in SHARES:
+                self.assertEqual(sketch.quantile(share), exact.quantile(share))
+
+
+class ExactQuantilesTest(unittest.TestCase):
+    def test_quantile_is_the_nearest_rank(self):
+        generator = random.Random(242)
+        values = [generator.randint(0, 100) for _ in range(1001)]
+        exact = ExactQuantiles().merge(QuantileSketch.from_dict(ExactQuantiles().to_dict()))
+        for value in values:
+            exact.add(value)
+        values.sort()
+        for share in SHARES:
+            self.assertEqual(exact.quantile(share), values[max(0, math.ceil(share * len(values)) - 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
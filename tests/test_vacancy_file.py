@@ -0,0 +1,74 @@
+import os
+import random
+import tempfile
+import unittest
+from vacancy_file import VacancyFile, VacancyFileError
+from vacancy_store import VacancyStore
+
+HEADLINE = [
+    "name", "description", "key_skills", "experience_id", "premium", "employer_name",
+    "salary_from", "salary_to", "salary_gross", "salary_currency", "area_name", "published_at"
+]
+
+
+def make_row(generator: random.Random) -> list:
+    salary_from = generator.choice((0.5, 10000, 35000.25, 1e9))
+    return [
+        generator.choice(("Программист", "Аналитик", "Тестировщик 1С")),
+        generator.choice(("", "Описание\nв две строки", "😀 " * generator.randint(1, 5))),
+        generator.sample(("Python", "SQL", "Git", "Linux"), generator.randint(1, 4)),
+        generator.choice(("noExperience", "between1And3")),
+        generator.choice(("False", "True")),
+        generator.choice(("Компания 1", "Компания 2", "ООО «Ёлка»")),
+        salary_from,
+        salary_from + generator.choice((0, 5000)),
+        generator.choice(("False", "True")),
+        generator.choice(("RUR", "USD")),
+        generator.choice(("Москва", "Санкт-Петербург")),
+        "20{0:02}-0{1}-1{2}T{3:02}:30:00{4}".format(
+            generator.randint(0, 22),
+            generator.randint(1, 9),
+            generator.randint(0, 9),
+            generator.randint(0, 23),
+            generator.choice(("+0300", "-0500", "+0545", "+0000"))
+        )
+    ]
+
+
+class VacancyFileTest(unittest.TestCase):
+    def test_round_trip_matches_source_store(self):
+        generator = random.Random(14)
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "vacancies" + VacancyFile.EXTENSION)
+            for size in (0, 1, 300):
+                store = VacancyStore.from_rows(HEADLINE, [make_row(generator) for _ in range(size)])
+                VacancyFile.write(store, file_name)
+                opened = VacancyFile.open(file_name)
+
+                self.assertEqual(len(opened), len(store))
+                self.assertEqual(opened.headline, store.headline)
+                self.assertEqual(sorted(opened.pools), sorted(store.pools))
+                for column, pool in store.pools.items():
+                    self.assertEqual(list(opened.pools[column].values), pool.values)
+                for column in VacancyStore.FLOAT_COLUMNS + VacancyStore.DATE_COLUMNS:
+                    self.assertEqual(list(opened.columns[column]), list(store.columns[column]))
+                self.assertEqual(list(opened.offsets), list(store.offsets))
+                self.assertEqual(list(opened.rows()), list(store.rows()))
+                for value in ("Москва", "Нет такого"):
+                    self.assertEqual(
+                        list(opened.get_index("area_name").lookup(value)),
+                        list(store.get_index("area_name").lookup(value))
+                    )
+
+    def test_rejects_foreign_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "vacancies" + VacancyFile.EXTENSION)
+            for content in (b"", b"VACB", b"name,salary\n", b"VACB\x01\x00\x00\x00\x05\x00\x00\x00{}"):
+                with open(file_name, "wb") as file:
+                    file.write(content)
+                with self.assertRaises(VacancyFileError):
+                    VacancyFile.open(file_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import re
+from typing import List
+from cleaner import Cleaner
+
+
+class TextTokenizer:
+    __WORD = re.compile("[0-9a-zа-я+#]+")
+    __CYRILLIC = re.compile("[а-я]")
+    __REFLEXIVE = ("ся", "сь")
+    __ENDINGS = tuple(sorted((
+        "иями", "ями", "ами", "ого", "его", "ому", "ему", "ыми", "ими", "ешь", "ишь", "ете", "ите", "ует", "уют",
+        "ает", "яет", "ают", "яют", "ость", "ости", "ение", "ения", "ений", "ению", "ением", "ировать",
+        "ая", "яя", "ое", "ее", "ие", "ые", "ой", "ей", "ий", "ый", "ую", "юю", "ом", "ем", "ам", "ям", "ах", "ях",
+        "ов", "ев", "ть", "ет", "ит", "ут", "ют", "ат", "ят", "ия", "ья", "ию", "ью", "ии", "ьи", "ых", "их",
+        "а", "я", "о", "е", "ы", "и", "у", "ю", "ь", "й"
+    ), key=len, reverse=True))
+    __MIN_STEM = 3
+    __CLEANER = Cleaner()
+    __stems = {}
+
+    @staticmethod
+    def tokenize(text: str, column: str = None) -> List[str]:
+        if column is not None:
+            text = TextTokenizer.__CLEANER.clean(text, column)
+        stems = TextTokenizer.__stems
+        result = []
+        for word in TextTokenizer.__WORD.findall(TextTokenizer.normalize(text)):
+            stem = stems.get(word)
+            if stem is None:
+                stem = TextTokenizer.stem(word)
+                stems[word] = stem
+            result.append(stem)
+        return result
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return text.lower().replace("ё", "е")
+
+    @staticmethod
+    def stem(word: str) -> str:
+        if not TextTokenizer.__CYRILLIC.search(word):
+            return word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+        for ending in TextTokenizer.__REFLEXIVE:
+            if word.endswith(ending) and len(word) - len(ending) >= TextTokenizer.__MIN_STEM:
+                word = word[:-len(ending)]
+                break
+        for ending in TextTokenizer.__ENDINGS:
+            if word.endswith(ending) and len(word) - len(ending) >= TextTokenizer.__MIN_STEM:
+                return word[:-len(ending)]
+        return word
@@ -0,0 +1,34 @@
+import asyncio
+import json
+from vacancy_server import QueryServer
+
+
+async def send_query(address: str, request: dict) -> dict:
+    host, port = QueryServer.parse_address(address)
+    if port is None:
+        reader, writer = await asyncio.open_unix_connection(path=host, limit=QueryServer.STREAM_LIMIT)
+    else:
+        reader, writer = await asyncio.open_connection(host=host, port=port, limit=QueryServer.STREAM_LIMIT)
+    try:
+        writer.write(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+    finally:
+        writer.close()
+
+
+if __name__ == "__main__":
+    client_address = input("Введите адрес (хост:порт или путь к сокету): ").strip() or "127.0.0.1:8765"
+    response = asyncio.run(send_query(client_address, {
+        "filter": input("Введите параметр фильтрации: "),
+        "sort": input("Введите параметр сортировки: "),
+        "reverse": input("Обратный порядок сортировки (Да / Нет): "),
+        "range": input("Введите диапазон вывода: "),
+        "columns": input("Введите требуемые столбцы: "),
+        "format": "json" if input("Вывести в JSON (Да / Нет): ").strip() == "Да" else "table"
+    }))
+    if response["status"] == "ok":
+        print(response["result"])
+    else:
+        print(response["message"])
+    print("Время запроса: {0:.2f} мс".format(response["elapsed_ms"]))
@@ -0,0 +1,186 @@
+import codecs
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import List, Sequence
+from cleaner import Cleaner
+from vacancy_store import VacancyStore, StringPool
+
+
+class VacancyFileError(BaseException):
+    pass
+
+
+class StringColumn:
+    def __init__(self, offsets: memoryview, blob: memoryview, is_list: bool = False):
+        self.offsets = offsets
+        self.blob = blob
+        self.is_list = is_list
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str or List[str]:
+        if index < 0:
+            index += len(self)
+        value = str(self.blob[self.offsets[index]:self.offsets[index + 1]], "utf-8")
+        return value.split("\n") if self.is_list else value
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+class VacancyFile:
+    EXTENSION = ".vacb"
+    VERSION = 1
+    __MAGIC = b"VACB"
+    __PREFIX = struct.Struct("<4sII")
+    __ALIGNMENT = 8
+    __CLEANER = Cleaner()
+
+    @staticmethod
+    def write(store: VacancyStore, file_name: str) -> None:
+        sections = []
+        columns = {}
+        for column in store.headline:
+            values = store.columns[column]
+            if column in store.pools:
+                columns[column] = {
+                    "kind": "encoded",
+                    "codes": VacancyFile.__add_section(sections, values),
+                    "pool": VacancyFile.__add_strings(sections, store.pools[column].values)
+                }
+            elif column in VacancyStore.FLOAT_COLUMNS or column in VacancyStore.DATE_COLUMNS:
+                columns[column] = {
+                    "kind": "date" if column in VacancyStore.DATE_COLUMNS else "float",
+                    "values": VacancyFile.__add_section(sections, values)
+                }
+            else:
+                is_list = any(isinstance(value, list) for value in values)
+                columns[column] = {
+                    "kind": "list" if is_list else "text",
+                    "values": VacancyFile.__add_strings(sections, [
+                        "\n".join(value) if isinstance(value, list) else value for value in values
+                    ])
+                }
+        header = json.dumps({
+            "byteorder": sys.byteorder,
+            "rows": len(store),
+            "headline": store.headline,
+            "columns": columns,
+            "offsets": VacancyFile.__add_section(sections, store.offsets)
+        }, ensure_ascii=False).encode("utf-8")
+
+        temp_name = "{0}.{1}.tmp".format(file_name, os.getpid())
+        with open(temp_name, "wb") as file:
+            file.write(VacancyFile.__PREFIX.pack(VacancyFile.__MAGIC, VacancyFile.VERSION, len(header)))
+            file.write(header)
+            file.write(b"\0" * VacancyFile.__padding(file.tell()))
+            for section in sections:
+                file.write(section)
+                file.write(b"\0" * VacancyFile.__padding(len(section)))
+        os.replace(temp_name, file_name)
+
+    @staticmethod
+    def open(file_name: str) -> VacancyStore:
+        with open(file_name, "rb") as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise VacancyFileError
+        if len(buffer) < VacancyFile.__PREFIX.size:
+            raise VacancyFileError
+        magic, version, header_size = VacancyFile.__PREFIX.unpack_from(buffer, 0)
+        if magic != VacancyFile.__MAGIC or version != VacancyFile.VERSION:
+            raise VacancyFileError
+        view = memoryview(buffer)
+        header_end = VacancyFile.__PREFIX.size + header_size
+        try:
+            header = json.loads(str(view[VacancyFile.__PREFIX.size:header_end], "utf-8"))
+            if header["byteorder"] != sys.byteorder:
+                raise VacancyFileError
+            data = view[header_end + VacancyFile.__padding(header_end):]
+
+            columns = {}
+            pools = {}
+            for column in header["headline"]:
+                layout = header["columns"][column]
+                if layout["kind"] == "encoded":
+                    columns[column] = VacancyFile.__get_section(data, layout["codes"])
+                    pools[column] = StringPool.from_values(VacancyFile.__get_strings(data, layout["pool"]))
+                elif layout["kind"] in ("float", "date"):
+                    columns[column] = VacancyFile.__get_section(data, layout["values"])
+                else:
+                    columns[column] = VacancyFile.__get_strings(data, layout["values"], layout["kind"] == "list")
+            return VacancyStore.from_columns(
+                header["headline"],
+                columns,
+                pools,
+                VacancyFile.__get_section(data, header["offsets"]),
+                header["rows"]
+            )
+        except (ValueError, KeyError, TypeError):
+            raise VacancyFileError
+
+    @staticmethod
+    def convert(csv_name: str, file_name: str) -> int:
+        reader = csv.reader(codecs.open(csv_name, "r", "utf_8_sig"), delimiter=',')
+        headline = reader.__next__()
+        store = VacancyStore(headline)
+        for vacancy in reader:
+            if len(vacancy) != len(headline) or '' in vacancy:
+                continue
+            store.append([
+                [VacancyFile.__CLEANER.clean(skill, column).strip() for skill in value.split('\n')]
+                if column == "key_skills" else VacancyFile.__CLEANER.clean(value, column).strip()
+                for value, column in zip(vacancy, headline)
+            ])
+        VacancyFile.write(store, file_name)
+        return len(store)
+
+    @staticmethod
+    def __add_section(sections: list, values: array) -> list:
+        offset = sum(len(section) + VacancyFile.__padding(len(section)) for section in sections)
+        sections.append(values.tobytes())
+        return [offset, len(values), values.typecode]
+
+    @staticmethod
+    def __add_strings(sections: list, values: Sequence[str]) -> list:
+        offsets = array('q', [0])
+        blob = []
+        for value in values:
+            encoded = value.encode("utf-8")
+            blob.append(encoded)
+            offsets.append(offsets[-1] + len(encoded))
+        offsets_section = VacancyFile.__add_section(sections, offsets)
+        blob_section = VacancyFile.__add_section(sections, array('B', b"".join(blob)))
+        return [offsets_section, blob_section]
+
+    @staticmethod
+    def __get_section(data: memoryview, section: list) -> memoryview:
+        offset, count, typecode = section
+        return data[offset:offset + count * array(typecode).itemsize].cast(typecode)
+
+    @staticmethod
+    def __get_strings(data: memoryview, sections: list, is_list: bool = False) -> StringColumn:
+        return StringColumn(
+            VacancyFile.__get_section(data, sections[0]),
+            VacancyFile.__get_section(data, sections[1]),
+            is_list
+        )
+
+    @staticmethod
+    def __padding(size: int) -> int:
+        return -size % VacancyFile.__ALIGNMENT
+
+
+if __name__ == "__main__":
+    csv_name = input("Введите название файла: ").strip()
+    file_name = input("Введите название выходного файла: ").strip() \
+        or os.path.splitext(csv_name)[0] + VacancyFile.EXTENSION
+    print("Записано вакансий: {0}".format(VacancyFile.convert(csv_name, file_name)))
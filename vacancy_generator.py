@@ -0,0 +1,142 @@
+import csv
+import os
+import random
+from typing import List
+
+
+class VacancyGenerator:
+    FULL_HEADLINE = [
+        "name",
+        "description",
+        "key_skills",
+        "experience_id",
+        "premium",
+        "employer_name",
+        "salary_from",
+        "salary_to",
+        "salary_gross",
+        "salary_currency",
+        "area_name",
+        "published_at"
+    ]
+    SHORT_HEADLINE = ["name", "salary_from", "salary_to", "salary_currency", "area_name", "published_at"]
+    SIZES = (10_000, 100_000, 1_000_000, 10_000_000)
+    INVALID_SHARE = 0.02
+    __NAMES = (
+        "Программист", "Python-разработчик", "Java-разработчик", "Frontend-разработчик", "Аналитик",
+        "Аналитик данных", "Системный администратор", "Тестировщик", "Менеджер по продажам", "Бухгалтер",
+        "Водитель", "Продавец-консультант", "Оператор call-центра", "Инженер", "Senior Python Developer",
+        "Программист 1С", "Специалист технической поддержки", "Руководитель проекта", "Дизайнер", "Юрист"
+    )
+    __CITIES = (
+        ("Москва", 300), ("Санкт-Петербург", 120), ("Новосибирск", 30), ("Екатеринбург", 30), ("Казань", 25),
+        ("Нижний Новгород", 20), ("Челябинск", 15), ("Самара", 15), ("Ростов-на-Дону", 15), ("Уфа", 12),
+        ("Краснодар", 12), ("Пермь", 10), ("Воронеж", 10), ("Красноярск", 10), ("Омск", 8), ("Минск", 20),
+        ("Алматы", 15), ("Киев", 15), ("Ташкент", 5), ("Баку", 4), ("Тбилиси", 3), ("Бишкек", 3),
+        ("Дубна", 1), ("Обнинск", 1), ("Королёв", 1), ("Иннополис", 1), ("Сочи", 2), ("Тюмень", 4)
+    )
+    __EMPLOYERS = (
+        "Яндекс", "СБЕР", "Тинькофф", "Контур", "ООО Ромашка", "ВКонтакте", "Ozon", "X5 Group", "МТС", "Билайн",
+        "ЛАНИТ", "EPAM", "Лаборатория Касперского", "ИП Иванов И.И.", "Procter & Gamble", "Газпром нефть"
+    )
+    __SKILLS = (
+        "Python", "SQL", "Git", "Linux", "Java", "JavaScript", "Go", "Docker", "PostgreSQL", "1С: Предприятие 8",
+        "Английский язык", "Деловая переписка", "Грамотная речь", "Работа в команде", "Активные продажи",
+        "MS Excel", "Django", "React", "Kubernetes", "Управление проектами"
+    )
+    __CURRENCIES = (
+        ("RUR", 850, 1), ("USD", 30, 60.66), ("EUR", 20, 59.90), ("KZT", 30, 0.13), ("UAH", 30, 1.64),
+        ("BYR", 25, 23.91), ("AZN", 5, 35.68), ("GEL", 3, 21.74), ("KGS", 3, 0.76), ("UZS", 4, 0.0055)
+    )
+    __EXPERIENCE = ("noExperience", "between1And3", "between3And6", "moreThan6")
+    __SECTIONS = (
+        "<p><strong>Обязанности:</strong></p>",
+        "<p><strong>Требования:</strong></p>",
+        "<p><strong>Условия:</strong></p>",
+        "<p>Мы&nbsp;— динамично развивающаяся компания.</p>",
+        "<p>Крупная компания   приглашает\xa0на работу.</p>"
+    )
+    __ITEMS = (
+        "разработка и поддержка сервисов", "работа с клиентами", "подготовка отчётности", "участие в код-ревью",
+        "оформление первичной документации", "опыт работы от 1 года", "знание SQL", "ответственность",
+        "официальное трудоустройство по ТК РФ", "ДМС после испытательного срока", "гибкий график",
+        "белая заработная плата", "обучение за счёт компании"
+    )
+
+    def __init__(self, seed: int = 0):
+        self.__random = random.Random(seed)
+        self.__cities = [city for city, _ in self.__CITIES]
+        self.__city_weights = [weight for _, weight in self.__CITIES]
+        self.__currencies = [(currency, rate) for currency, _, rate in self.__CURRENCIES]
+        self.__currency_weights = [weight for _, weight, _ in self.__CURRENCIES]
+
+    def write(self, file_name: str, rows: int, is_short: bool = False) -> int:
+        directory = os.path.dirname(file_name)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(file_name, "w", newline='', encoding="utf_8_sig") as file:
+            writer = csv.writer(file)
+            writer.writerow(self.SHORT_HEADLINE if is_short else self.FULL_HEADLINE)
+            for _ in range(rows):
+                writer.writerow(self.make_row(is_short))
+        return rows
+
+    def make_row(self, is_short: bool = False) -> List[str]:
+        currency, rate = self.__random.choices(self.__currencies, self.__currency_weights)[0]
+        salary_from = self.__random.randint(15, 300) * 1000
+        salary_to = salary_from + self.__random.randint(0, 150) * 1000
+        row = {
+            "name": self.__random.choice(self.__NAMES),
+            "salary_from": self.__convert(salary_from, rate),
+            "salary_to": self.__convert(salary_to, rate),
+            "salary_currency": currency,
+            "area_name": self.__random.choices(self.__cities, self.__city_weights)[0],
+            "published_at": self.__make_date()
+        }
+        if not is_short:
+            row.update({
+                "description": self.__make_description(),
+                "key_skills": "\n".join(self.__random.sample(self.__SKILLS, self.__random.randint(1, 6))),
+                "experience_id": self.__random.choice(self.__EXPERIENCE),
+                "premium": self.__random.choice(("False", "False", "False", "True", "FALSE", "TRUE")),
+                "employer_name": self.__random.choice(self.__EMPLOYERS),
+                "salary_gross": self.__random.choice(("True", "False"))
+            })
+        values = [row[column] for column in (self.SHORT_HEADLINE if is_short else self.FULL_HEADLINE)]
+        if self.__random.random() < self.INVALID_SHARE:
+            values[self.__random.randrange(len(values))] = ""
+        return values
+
+    @staticmethod
+    def __convert(salary: int, rate: float) -> str:
+        return str(max(int(round(salary / rate, -2)), 100))
+
+    def __make_description(self) -> str:
+        parts = []
+        for _ in range(self.__random.randint(1, 4)):
+            parts.append(self.__random.choice(self.__SECTIONS))
+            items = self.__random.sample(self.__ITEMS, self.__random.randint(1, 5))
+            parts.append("<ul>" + "".join("<li>" + item + "</li>" for item in items) + "</ul>")
+            if self.__random.random() < 0.3:
+                parts.append("\n")
+        return "".join(parts)
+
+    def __make_date(self) -> str:
+        return "{0:04d}-{1:02d}-{2:02d}T{3:02d}:{4:02d}:{5:02d}+0300".format(
+            self.__random.randint(2007, 2022),
+            self.__random.randint(1, 12),
+            self.__random.randint(1, 28),
+            self.__random.randint(0, 23),
+            self.__random.randint(0, 59),
+            self.__random.randint(0, 59)
+        )
+
+
+if __name__ == "__main__":
+    file_name = input("Введите название файла: ").strip()
+    rows = int(input("Введите количество строк ({0}): ".format(
+        ", ".join(str(size) for size in VacancyGenerator.SIZES)
+    )).strip() or VacancyGenerator.SIZES[0])
+    is_short = input("Короткий формат (Да / Нет): ").strip() == "Да"
+    seed = int(input("Введите seed: ").strip() or 0)
+    print("Записано вакансий: {0}".format(VacancyGenerator(seed).write(file_name, rows, is_short)))
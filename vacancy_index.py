@@ -0,0 +1,206 @@
+import math
+from array import array
+from bisect import bisect_left
+from typing import List, Sequence, Tuple, Iterable, TYPE_CHECKING
+from text_tokenizer import TextTokenizer
+
+if TYPE_CHECKING:
+    from vacancy_store import VacancyStore
+
+
+class EqualityIndex:
+    def __init__(self, store: "VacancyStore", column: str):
+        self.column = column
+        self.__pool = store.pools.get(column)
+        if self.__pool is not None:
+            self.__postings = [array('i') for _ in range(len(self.__pool))]
+            for row_id, code in enumerate(store.columns[column]):
+                self.__postings[code].append(row_id)
+        else:
+            self.__postings = {}
+            for row_id, value in enumerate(store.columns[column]):
+                postings = self.__postings.get(value)
+                if postings is None:
+                    postings = array('i')
+                    self.__postings[value] = postings
+                postings.append(row_id)
+
+    def lookup(self, value: str) -> array:
+        if self.__pool is None:
+            return self.__postings.get(value, array('i'))
+        code = self.__pool.code_of(value)
+        return self.__postings[code] if code >= 0 else array('i')
+
+
+class IntervalIndex:
+    def __init__(self, lows: Sequence[int], highs: Sequence[int]):
+        self.__lows = lows
+        self.__highs = highs
+        self.__nodes = []
+        row_ids = [row_id for row_id in range(len(lows)) if lows[row_id] <= highs[row_id]]
+        self.__root = self.__build(row_ids) if row_ids else -1
+
+    def stab(self, point: int) -> array:
+        result = array('i')
+        node_id = self.__root
+        while node_id != -1:
+            center, by_low, lows, by_high, highs, left, right = self.__nodes[node_id]
+            if point < center:
+                for row_id, low in zip(by_low, lows):
+                    if low > point:
+                        break
+                    result.append(row_id)
+                node_id = left
+            elif point > center:
+                for row_id, high in zip(by_high, highs):
+                    if high < point:
+                        break
+                    result.append(row_id)
+                node_id = right
+            else:
+                result.extend(by_low)
+                break
+        return array('i', sorted(result))
+
+    def __build(self, row_ids: List[int]) -> int:
+        endpoints = sorted([self.__lows[row_id] for row_id in row_ids] + [self.__highs[row_id] for row_id in row_ids])
+        center = endpoints[len(endpoints) // 2]
+        left, right, middle = [], [], []
+        for row_id in row_ids:
+            if self.__highs[row_id] < center:
+                left.append(row_id)
+            elif self.__lows[row_id] > center:
+                right.append(row_id)
+            else:
+                middle.append(row_id)
+        by_low = sorted(middle, key=lambda row_id: self.__lows[row_id])
+        by_high = sorted(middle, key=lambda row_id: self.__highs[row_id], reverse=True)
+        node_id = len(self.__nodes)
+        self.__nodes.append(None)
+        self.__nodes[node_id] = (
+            center,
+            array('i', by_low),
+            array('q', [self.__lows[row_id] for row_id in by_low]),
+            array('i', by_high),
+            array('q', [self.__highs[row_id] for row_id in by_high]),
+            self.__build(left) if left else -1,
+            self.__build(right) if right else -1
+        )
+        return node_id
+
+
+class SkillIndex:
+    def __init__(self, rows: Iterable[List[str] or str]):
+        self.vocabulary = {}
+        self.__postings = []
+        self.__offsets = array('q', [0])
+        self.__skills = array('i')
+        for row_id, skills in enumerate(rows):
+            codes = set()
+            for skill in (skills if isinstance(skills, list) else [skills]):
+                code = self.vocabulary.get(skill)
+                if code is None:
+                    code = len(self.vocabulary)
+                    self.vocabulary[skill] = code
+                    self.__postings.append(array('i'))
+                codes.add(code)
+            for code in sorted(codes):
+                self.__postings[code].append(row_id)
+                self.__skills.append(code)
+            self.__offsets.append(len(self.__skills))
+
+    def lookup_all(self, skills: List[str]) -> array:
+        codes = []
+        for skill in set(skills):
+            code = self.vocabulary.get(skill)
+            if code is None:
+                return array('i')
+            codes.append(code)
+        codes.sort(key=lambda code: len(self.__postings[code]))
+        if len(codes) == 1:
+            return self.__postings[codes[0]]
+        result = array('i')
+        for row_id in self.__postings[codes[0]]:
+            if all(self.__has_skill(row_id, code) for code in codes[1:]):
+                result.append(row_id)
+        return result
+
+    def __has_skill(self, row_id: int, code: int) -> bool:
+        end = self.__offsets[row_id + 1]
+        position = bisect_left(self.__skills, code, self.__offsets[row_id], end)
+        return position < end and self.__skills[position] == code
+
+
+class TextIndex:
+    COLUMNS = ("name", "description")
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, store: "VacancyStore", columns: Sequence[str] = COLUMNS):
+        self.columns = [column for column in columns if column in store]
+        self.vocabulary = {}
+        self.__postings = []
+        self.__frequencies = []
+        self.lengths = array('i')
+        for row_id in range(len(store)):
+            counts = {}
+            for column in self.columns:
+                value = store.get(row_id, column)
+                for term in TextTokenizer.tokenize("\n".join(value) if isinstance(value, list) else value, column):
+                    counts[term] = counts.get(term, 0) + 1
+            for term, count in counts.items():
+                code = self.vocabulary.get(term)
+                if code is None:
+                    code = len(self.vocabulary)
+                    self.vocabulary[term] = code
+                    self.__postings.append(array('i'))
+                    self.__frequencies.append(array('i'))
+                self.__postings[code].append(row_id)
+                self.__frequencies[code].append(count)
+            self.lengths.append(sum(counts.values()))
+        self.average_length = sum(self.lengths) / len(self.lengths) if len(self.lengths) else 0.0
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def search(self, query: str) -> array:
+        codes = []
+        for term in set(TextTokenizer.tokenize(query)):
+            code = self.vocabulary.get(term)
+            if code is None:
+                return array('i')
+            codes.append(code)
+        if len(codes) == 0:
+            return array('i', range(len(self)))
+        codes.sort(key=lambda code: len(self.__postings[code]))
+        result = self.__postings[codes[0]]
+        for code in codes[1:]:
+            postings = self.__postings[code]
+            result = array('i', (row_id for row_id in result if self.__contains(postings, row_id)))
+        return result
+
+    def rank(self, query: str, row_ids: Iterable[int] = None) -> List[Tuple[int, float]]:
+        candidates = None if row_ids is None else set(row_ids)
+        scores = dict.fromkeys(candidates, 0.0) if candidates is not None else {}
+        for term in set(TextTokenizer.tokenize(query)):
+            code = self.vocabulary.get(term)
+            if code is None:
+                continue
+            postings = self.__postings[code]
+            idf = math.log(1 + (len(self) - len(postings) + 0.5) / (len(postings) + 0.5))
+            for row_id, frequency in zip(postings, self.__frequencies[code]):
+                if candidates is not None and row_id not in candidates:
+                    continue
+                norm = self.K1 * (1 - self.B + self.B * self.lengths[row_id] / (self.average_length or 1))
+                scores[row_id] = scores.get(row_id, 0.0) + idf * frequency * (self.K1 + 1) / (frequency + norm)
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    @staticmethod
+    def matches(text: str, query: str, column: str = "description") -> bool:
+        terms = set(TextTokenizer.tokenize(text, column))
+        return all(term in terms for term in TextTokenizer.tokenize(query))
+
+    @staticmethod
+    def __contains(postings: array, row_id: int) -> bool:
+        position = bisect_left(postings, row_id)
+        return position < len(postings) and postings[position] == row_id
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Dict, Tuple
+from accumulator import Accumulator
+from parse_cache import ParseCache
+from task5 import DataSet, InputConnect, SortParameterError, SortWayError, OutOfDataError
+
+
+class QueryMetrics:
+    def __init__(self, window: int = 1000):
+        self.latency = Accumulator()
+        self.errors = 0
+        self.recent = deque(maxlen=window)
+        self.__lock = threading.Lock()
+
+    def add(self, elapsed: float, is_error: bool) -> None:
+        with self.__lock:
+            self.latency.add(elapsed)
+            self.recent.append(elapsed)
+            if is_error:
+                self.errors += 1
+
+    def percentile(self, share: float) -> float:
+        with self.__lock:
+            latencies = sorted(self.recent)
+        if len(latencies) == 0:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(share * len(latencies)))]
+
+    def to_dict(self) -> Dict[str, float]:
+        with self.__lock:
+            latency = {
+                "queries": self.latency.count,
+                "errors": self.errors,
+                "mean_ms": self.latency.mean,
+                "min_ms": self.latency.min or 0.0,
+                "max_ms": self.latency.max or 0.0
+            }
+        return {
+            **latency,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95)
+        }
+
+
+class QueryServer:
+    STREAM_LIMIT = 2 ** 30
+    __ERRORS = (
+        (StopIteration, "Пустой файл"),
+        (IOError, "Формат ввода некорректен"),
+        (KeyError, "Параметр поиска некорректен"),
+        (SortParameterError, "Параметр сортировки некорректен"),
+        (SortWayError, "Порядок сортировки задан некорректно"),
+        (AssertionError, "Ничего не найдено"),
+        (OutOfDataError, "Нет данных")
+    )
+
+    def __init__(self, file_name: str, cache: ParseCache = None):
+        self.file_name = file_name
+        self.store = DataSet(file_name=file_name, columnar=True, cache=cache).get_store()
+        self.metrics = QueryMetrics()
+        self.__warm_indexes()
+
+    def __warm_indexes(self) -> None:
+        self.store.get_salary_index()
+        if "key_skills" in self.store:
+            self.store.get_skill_index()
+        if "description" in self.store:
+            self.store.get_text_index()
+        for column in self.store.headline:
+            if column not in self.store.FLOAT_COLUMNS + self.store.DATE_COLUMNS + ("key_skills",):
+                self.store.get_index(column)
+        for pool in self.store.pools.values():
+            pool.code_of("")
+
+    def execute(self, request: dict) -> dict:
+        if request.get("command") == "metrics":
+            return {"status": "ok", "metrics": self.metrics.to_dict()}
+
+        start = time.perf_counter()
+        try:
+            input_connect = InputConnect(
+                self.file_name,
+                request.get("filter", ""),
+                request.get("sort", ""),
+                request.get("reverse", ""),
+                request.get("range", ""),
+                request.get("columns", ""),
+                store=self.store
+            )
+            result = input_connect.to_json() if request.get("format") == "json" else input_connect.__str__()
+            response = {"status": "ok", "result": result}
+        except (Exception, SortParameterError, SortWayError, OutOfDataError) as error:
+            response = {"status": "error", "message": self.__get_message(error)}
+        elapsed = (time.perf_counter() - start) * 1000
+        self.metrics.add(elapsed, response["status"] == "error")
+        response["elapsed_ms"] = elapsed
+        return response
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {"status": "error", "message": "Формат запроса некорректен"}
+                else:
+                    response = await loop.run_in_executor(None, self.execute, request)
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, address: str) -> None:
+        host, port = self.parse_address(address)
+        if port is None:
+            server = await asyncio.start_unix_server(self.handle, path=host, limit=self.STREAM_LIMIT)
+        else:
+            server = await asyncio.start_server(self.handle, host=host, port=port, limit=self.STREAM_LIMIT)
+        async with server:
+            await server.serve_forever()
+
+    @staticmethod
+    def parse_address(address: str) -> Tuple[str, int or None]:
+        if ':' not in address:
+            return address, None
+        host, port = address.rsplit(':', 1)
+        return host or "127.0.0.1", int(port)
+
+    @staticmethod
+    def __get_message(error: BaseException) -> str:
+        for error_type, message in QueryServer.__ERRORS:
+            if isinstance(error, error_type):
+                return message
+        return error.__repr__()
+
+
+if __name__ == "__main__":
+    server_file = input("Введите название файла: ").strip()
+    server_address = input("Введите адрес (хост:порт или путь к сокету): ").strip() or "127.0.0.1:8765"
+    query_server = QueryServer(server_file, cache=ParseCache())
+    print("Загружено вакансий: {0}, адрес: {1}".format(len(query_server.store), server_address))
+    try:
+        asyncio.run(query_server.serve(server_address))
+    except KeyboardInterrupt:
+        print(json.dumps(query_server.metrics.to_dict(), ensure_ascii=False))
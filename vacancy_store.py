@@ -0,0 +1,201 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import List, Generator, Sequence
+from date_parser import DateParser
+from vacancy_index import EqualityIndex, IntervalIndex, SkillIndex, TextIndex
+
+
+class StringPool:
+    def __init__(self):
+        self.values = []
+        self.__codes = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @classmethod
+    def from_values(cls, values: Sequence[str]) -> "StringPool":
+        pool = cls()
+        pool.values = values
+        pool.__codes = None
+        return pool
+
+    def __get_codes(self) -> dict:
+        if self.__codes is None:
+            self.__codes = {value: code for code, value in enumerate(self.values)}
+        return self.__codes
+
+    def encode(self, value: str) -> int:
+        if self.__codes is None:
+            self.values = list(self.values)
+            self.__get_codes()
+        code = self.__codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.__codes[value] = code
+            self.values.append(value)
+        return code
+
+    def intern(self, value: str) -> str:
+        return self.values[self.encode(value)]
+
+    def code_of(self, value: str) -> int:
+        return self.__get_codes().get(value, -1)
+
+
+class VacancyStore:
+    FLOAT_COLUMNS = ("salary_from", "salary_to")
+    DATE_COLUMNS = ("published_at",)
+    ENCODED_COLUMNS = (
+        "name",
+        "experience_id",
+        "premium",
+        "employer_name",
+        "salary_gross",
+        "salary_currency",
+        "area_name"
+    )
+    __date_parser = DateParser(DateParser.EPOCH)
+
+    def __init__(self, headline: List[str]):
+        self.headline = list(headline)
+        self.columns = {}
+        self.pools = {}
+        self.offsets = array('h')
+        self.indexes = {}
+        self.__size = 0
+        for column in self.headline:
+            if column in self.FLOAT_COLUMNS:
+                self.columns[column] = array('d')
+            elif column in self.DATE_COLUMNS:
+                self.columns[column] = array('q')
+            elif column in self.ENCODED_COLUMNS:
+                self.columns[column] = array('i')
+                self.pools[column] = StringPool()
+            else:
+                self.columns[column] = []
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+    def append(self, values: List[any]) -> None:
+        for column, value in zip(self.headline, values):
+            if column in self.pools:
+                self.columns[column].append(self.pools[column].encode(value))
+            elif column in self.FLOAT_COLUMNS:
+                self.columns[column].append(float(value))
+            elif column in self.DATE_COLUMNS:
+                if isinstance(value, datetime):
+                    if value.tzinfo is None:
+                        value = value.replace(tzinfo=timezone.utc)
+                    timestamp, offset = int(value.timestamp()), int(value.utcoffset().total_seconds()) // 60
+                else:
+                    timestamp, offset = self.__date_parser.parse_with_offset(value)
+                self.columns[column].append(timestamp)
+                self.offsets.append(offset)
+            else:
+                self.columns[column].append(value)
+        self.__size += 1
+
+    def get(self, index: int, column: str) -> any:
+        value = self.columns[column][index]
+        if column in self.pools:
+            return self.pools[column].values[value]
+        if column in self.DATE_COLUMNS:
+            return datetime.fromtimestamp(value, DateParser.get_timezone(self.offsets[index]))
+        return value
+
+    def row(self, index: int) -> List[any]:
+        return [self.get(index, column) for column in self.headline]
+
+    def rows(self) -> Generator[List[any], None, None]:
+        for index in range(self.__size):
+            yield self.row(index)
+
+    def decoded(self, column: str) -> List[str]:
+        values = list(self.pools[column].values)
+        return [values[code] for code in self.columns[column]]
+
+    def get_index(self, column: str) -> EqualityIndex:
+        index = self.indexes.get(column)
+        if index is None:
+            index = EqualityIndex(self, column)
+            self.indexes[column] = index
+        return index
+
+    def get_salary_index(self) -> IntervalIndex:
+        index = self.indexes.get("salary")
+        if index is None:
+            index = IntervalIndex(
+                array('q', map(int, self.columns["salary_from"])),
+                array('q', map(int, self.columns["salary_to"]))
+            )
+            self.indexes["salary"] = index
+        return index
+
+    def get_skill_index(self, column: str = "key_skills") -> SkillIndex:
+        index = self.indexes.get(column)
+        if index is None:
+            index = SkillIndex(self.columns[column])
+            self.indexes[column] = index
+        return index
+
+    def get_text_index(self) -> TextIndex:
+        index = self.indexes.get("text")
+        if index is None:
+            index = TextIndex(self)
+            self.indexes["text"] = index
+        return index
+
+    def years(self, column: str = "published_at") -> array:
+        years = array('h')
+        cache = {}
+        for timestamp, offset in zip(self.columns[column], self.offsets):
+            day = (timestamp + offset * 60) // 86400
+            year = cache.get(day)
+            if year is None:
+                year = (datetime(1970, 1, 1) + timedelta(days=day)).year
+                cache[day] = year
+            years.append(year)
+        return years
+
+    @classmethod
+    def from_rows(cls, headline: List[str], rows: Generator[List[any], None, None]) -> "VacancyStore":
+        store = cls(headline)
+        for row in rows:
+            store.append(row)
+        return store
+
+    @classmethod
+    def concat(cls, stores: Sequence["VacancyStore"]) -> "VacancyStore":
+        store = cls(stores[0].headline)
+        for part in stores:
+            for column in store.headline:
+                if column in store.pools:
+                    codes = [store.pools[column].encode(value) for value in part.pools[column].values]
+                    store.columns[column].extend(codes[code] for code in part.columns[column])
+                else:
+                    store.columns[column].extend(part.columns[column])
+            store.offsets.extend(part.offsets)
+            store.__size += len(part)
+        return store
+
+    @classmethod
+    def from_columns(
+            cls,
+            headline: List[str],
+            columns: dict,
+            pools: dict,
+            offsets: Sequence[int],
+            size: int
+    ) -> "VacancyStore":
+        store = cls([])
+        store.headline = list(headline)
+        store.columns = columns
+        store.pools = pools
+        store.offsets = offsets
+        store.__size = size
+        return store
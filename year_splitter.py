@@ -0,0 +1,85 @@
+import codecs
+import csv
+import os
+import re
+from array import array
+from typing import Dict, List
+from cleaner import Cleaner
+from date_parser import DateParser
+
+
+class YearSplitter:
+    PARTITION_EXTENSION = ".csv"
+    POSITIONS_EXTENSION = ".rows"
+    __PARTITION_NAME = re.compile("^[0-9]+\\.(csv|rows)$")
+    __CLEANER = Cleaner()
+
+    @staticmethod
+    def split(file_name: str, directory: str) -> Dict[int, str]:
+        os.makedirs(directory, exist_ok=True)
+        for entry in os.listdir(directory):
+            if YearSplitter.__PARTITION_NAME.match(entry):
+                os.remove(os.path.join(directory, entry))
+
+        parser = DateParser(DateParser.YEAR)
+        reader = csv.reader(codecs.open(file_name, "r", "utf_8_sig"), delimiter=',')
+        headline = reader.__next__()
+        published_at = headline.index("published_at")
+        files = {}
+        writers = {}
+        positions = {}
+        try:
+            for position, vacancy in enumerate(reader):
+                if len(vacancy) != len(headline) or '' in vacancy:
+                    continue
+                year = parser.parse(YearSplitter.__CLEANER.clean(vacancy[published_at], "published_at").strip())
+                writer = writers.get(year)
+                if writer is None:
+                    files[year] = open(YearSplitter.get_partition(directory, year), "w", newline='', encoding="utf-8")
+                    writer = csv.writer(files[year])
+                    writer.writerow(headline)
+                    writers[year] = writer
+                    positions[year] = array('q')
+                writer.writerow(vacancy)
+                positions[year].append(position)
+        finally:
+            for file in files.values():
+                file.close()
+
+        for year, year_positions in positions.items():
+            with open(YearSplitter.get_positions_file(YearSplitter.get_partition(directory, year)), "wb") as file:
+                year_positions.tofile(file)
+        return {year: YearSplitter.get_partition(directory, year) for year in sorted(files)}
+
+    @staticmethod
+    def get_partitions(directory: str) -> List[str]:
+        partitions = []
+        for entry in os.listdir(directory):
+            name, extension = os.path.splitext(entry)
+            path = os.path.join(directory, entry)
+            if extension == YearSplitter.PARTITION_EXTENSION and name.isdigit() \
+                    and os.path.exists(YearSplitter.get_positions_file(path)):
+                partitions.append(path)
+        return sorted(partitions)
+
+    @staticmethod
+    def get_partition(directory: str, year: int) -> str:
+        return os.path.join(directory, str(year) + YearSplitter.PARTITION_EXTENSION)
+
+    @staticmethod
+    def get_positions_file(partition: str) -> str:
+        return os.path.splitext(partition)[0] + YearSplitter.POSITIONS_EXTENSION
+
+    @staticmethod
+    def read_positions(partition: str) -> array:
+        positions = array('q')
+        with open(YearSplitter.get_positions_file(partition), "rb") as file:
+            positions.frombytes(file.read())
+        return positions
+
+
+if __name__ == "__main__":
+    file_name = input("Введите название файла: ").strip()
+    directory = input("Введите папку для разбиения: ").strip() or os.path.splitext(file_name)[0] + "_by_year"
+    for year, partition in YearSplitter.split(file_name, directory).items():
+        print("{0}: {1}".format(year, partition))